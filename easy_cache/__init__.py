@@ -14,11 +14,28 @@ __author__ = "Peter Bergen"
 __email__ = "bergen@peterbergen-softwaresolutions.de"
 __license__ = "MIT"
 
-from .exceptions import (
-    EasyCacheException,
-    CacheKeyValidationError,
-)
-from .decorators.easy_cache import easy_cache
+from importlib import import_module
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package does not pull in the decorators, cache backends and cron parsing.
+_LAZY_ATTRIBUTES = {
+    "easy_cache": ".decorators.easy_cache",
+    "EasyCacheException": ".exceptions",
+    "CacheKeyValidationError": ".exceptions",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 __all__ = [
@@ -40,9 +40,11 @@ class CacheEntryAdmin(admin.ModelAdmin):
         qs = super().get_queryset(request)
         # Annotate with calculated fields to avoid N+1 queries
         current_time = timezone.now()
-        return qs.annotate(
-            time_remaining=ExpressionWrapper(F("expires_at") - current_time, output_field=DurationField())
-        ).select_related()  # Add if there are ForeignKeys
+        return (
+            qs.with_stats()
+            .annotate(time_remaining=ExpressionWrapper(F("expires_at") - current_time, output_field=DurationField()))
+            .select_related()  # Add if there are ForeignKeys
+        )
 
     @admin.display(description="Cache Key")
     def cache_key_short(self, obj):
@@ -63,9 +65,10 @@ class CacheEntryAdmin(admin.ModelAdmin):
             total_seconds = obj.time_remaining.total_seconds()
             is_expired = total_seconds <= 0
         else:
-            # Fallback to model property
-            is_expired = obj.is_expired
-            total_seconds = obj.time_left_seconds if not is_expired else 0
+            # Fallback to the model, evaluated against a single timestamp
+            now = timezone.now()
+            is_expired = obj.is_expired_at(now)
+            total_seconds = obj.time_left_at(now).total_seconds() if not is_expired else 0
 
         if is_expired:
             return format_html(
@@ -93,11 +96,13 @@ class CacheEntryAdmin(admin.ModelAdmin):
 
     @admin.display(
         description="Hit Rate",
-        ordering="hit_count",
+        ordering="hit_percentage",
     )
     def hit_rate_display(self, obj):
-        # return obj.hit_count
-        rate = obj.hit_rate
+        # Prefer the database-computed annotation from with_stats()
+        rate = getattr(obj, "hit_percentage", None)
+        if rate is None:
+            rate = obj.hit_rate
         color = "green" if rate >= 80 else "orange" if rate >= 60 else "red"
         return format_html('<span style="color: {};">{}</span>', color, format(rate, ".1f") + "%")
 
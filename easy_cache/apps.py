@@ -29,7 +29,7 @@ class DjangoEasyCacheConfig(AppConfig):
     def _is_analytics_enabled(self) -> bool:
         """Check if cache analytics are enabled"""
         easy_cache_settings = getattr(settings, "easy_cache", {})
-        return easy_cache_settings.get("ANALYTICS_ENABLED", False)
+        return easy_cache_settings.get("ANALYTICS_ENABLED", True)
 
     def _is_debug_toolbar_enabled(self) -> bool:
         """Check if debug toolbar integration is enabled"""
@@ -76,10 +76,12 @@ def check_easy_cache_settings(app_configs, **kwargs):
     """Django system check for Easy Cache configuration"""
     errors = []
 
-    easy_cache_settings = getattr(settings, "easy_cache", {})
+    cfg = getattr(settings, "easy_cache", {})
+    caches = getattr(settings, "CACHES", None)
+    installed = frozenset(settings.INSTALLED_APPS)
 
     # Check if caches are configured
-    if not hasattr(settings, "CACHES") or not settings.CACHES:
+    if not caches:
         errors.append(
             Error(
                 "No cache backends configured",
@@ -89,8 +91,8 @@ def check_easy_cache_settings(app_configs, **kwargs):
         )
 
     # Check default cache backend
-    default_backend = easy_cache_settings.get("DEFAULT_BACKEND", "default")
-    if default_backend not in settings.CACHES:
+    default_backend = cfg.get("DEFAULT_BACKEND", "default")
+    if default_backend not in (caches or {}):
         errors.append(
             Error(
                 f'Easy Cache default backend "{default_backend}" not found in CACHES',
@@ -100,9 +102,9 @@ def check_easy_cache_settings(app_configs, **kwargs):
         )
 
     # Check real-time configuration
-    realtime_config = easy_cache_settings.get("REALTIME", {})
+    realtime_config = cfg.get("REALTIME", {})
     if realtime_config.get("ENABLED", False):
-        if "channels" not in settings.INSTALLED_APPS:
+        if "channels" not in installed:
             errors.append(
                 Error(
                     "Real-time features enabled but channels not in INSTALLED_APPS",
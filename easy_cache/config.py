@@ -25,10 +25,16 @@ class EasyCacheConfig:
         "KEY_PREFIX": "easy_cache",
         # Value length for each key
         "MAX_VALUE_LENGTH": 100,
+        # Size of the BLAKE2b parameter hash in cache keys (8-512, multiple of 8)
+        "KEY_HASH_BITS": 64,
+        # Entries kept in the process-local L1 cache in front of the backend (0 disables it)
+        "L1_SIZE": 0,
         # Types to auto-exclude from cache keys (inherently unstable/dynamic)
         "DEFAULT_EXCLUDE_TYPES": (datetime, date, time, uuid.UUID),
         "DEBUG_TOOLBAR_INTEGRATION": False,  # not implemented yes
         # Analytics & Monitoring
+        # When False, decorators use a no-op tracker and never write CacheEntry/CacheEventHistory rows
+        "ANALYTICS_ENABLED": True,
         "TRACKING": {
             "TRACK_CACHE_HITS": False,
             "TRACK_CACHE_MISSES": True,
@@ -39,6 +45,13 @@ class EasyCacheConfig:
             "EVENT_CACHE_MISSES": False,
             "EVENT_CACHE_ERRORS": False,
         },
+        # Write events from a background thread in bulk instead of one INSERT per lookup
+        "EVENT_BATCHING": {
+            "ENABLED": False,
+            "QUEUE_SIZE": 10000,
+            "BATCH_SIZE": 500,
+            "FLUSH_INTERVAL": 0.5,
+        },
     }
 
     def __new__(cls):
@@ -85,6 +98,18 @@ class EasyCacheConfig:
         if default_backend not in settings.CACHES:
             raise ImproperlyConfigured(f"Easy Cache default backend '{default_backend}' not found in CACHES setting")
 
+        # Validate the params hash size; BLAKE2b digests are 1 to 64 bytes
+        key_hash_bits = self._config["KEY_HASH_BITS"]
+        if (
+            not isinstance(key_hash_bits, int)
+            or isinstance(key_hash_bits, bool)
+            or not 8 <= key_hash_bits <= 512
+            or key_hash_bits % 8
+        ):
+            raise ImproperlyConfigured(
+                f"Easy Cache KEY_HASH_BITS must be a multiple of 8 between 8 and 512, got {key_hash_bits!r}"
+            )
+
     def _initialize_cache_backends(self):
         """Initialize and validate cache backends"""
         for backend_name in settings.CACHES.keys():
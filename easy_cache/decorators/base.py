@@ -1,20 +1,39 @@
 import logging
 import time
+from collections.abc import Callable
 from datetime import datetime
 from functools import wraps
-from typing import Optional, Any
-from collections.abc import Callable
+from typing import Any, Optional
 
 from django.conf import settings
 from django.utils import timezone
 
 from easy_cache import CacheKeyValidationError
 from easy_cache.config import get_config
-from easy_cache.services import AnalyticsTracker, KeyGenerator, StorageHandler
+from easy_cache.services import AnalyticsTracker, KeyGenerator, NoopAnalyticsTracker, StorageHandler
+from easy_cache.services.event_batcher import get_event_batcher
+from easy_cache.services.l1 import get_l1_cache
 
 logger = logging.getLogger(__name__)
 
 
+class _TemplateResponseCacheCallback:
+    """Post-render callback that stores a TemplateResponse; holds only what it needs to do so"""
+
+    __slots__ = ("cache_key", "storage", "timeout")
+
+    def __init__(self, storage, cache_key: str, timeout: int):
+        self.storage = storage
+        self.cache_key = cache_key
+        self.timeout = timeout
+
+    def __call__(self, response):
+        try:
+            self.storage.set(self.cache_key, response, self.timeout)
+        except Exception as e:
+            logger.warning(f"Failed to cache template response: {e}")
+
+
 class BaseCacheDecorator:
     """
     Base class for cache decorators with shared logic and expiration-based caching.
@@ -41,6 +60,7 @@ class BaseCacheDecorator:
         timeout (Optional[int]): Default cache timeout in seconds
         key_template (str): Template for generating cache keys
         cache_name (str): Name of the Django cache backend to use
+        key_args (Optional[Callable]): Selects the arguments that identify a call for the cache key
         cache: Django cache backend instance
         config: EasyCacheConfig instance
     """
@@ -48,19 +68,18 @@ class BaseCacheDecorator:
     @staticmethod
     def _cache_template_response_callback(storage, cache_key: str, timeout: int):
         """Static callback to avoid closure memory leaks"""
-
-        def callback(response):
-            try:
-                storage.set(cache_key, response, timeout)
-            except Exception as e:
-                logger.warning(f"Failed to cache template response: {e}")
-
-        return callback
-
-    def __init__(self, timezone_name: str | None = None, cache_backend: str = "default") -> None:
+        return _TemplateResponseCacheCallback(storage, cache_key, timeout)
+
+    def __init__(
+        self,
+        timezone_name: str | None = None,
+        cache_backend: str = "default",
+        key_args: Callable[..., Any] | None = None,
+    ) -> None:
         # Get configuration
         self.config = get_config()
         self.timezone_name = timezone_name or settings.TIME_ZONE
+        self.key_args = key_args
         self.cache_name = cache_backend or self.config.get("CACHE_BACKEND")
         self._cache_checked = False
 
@@ -73,7 +92,12 @@ class BaseCacheDecorator:
         # Separated components
         self.key_generator = KeyGenerator(prefix=self.config.get("KEY_PREFIX"))
         self.storage = StorageHandler(self.cache)
-        self.analytics = AnalyticsTracker(self.config)
+        self.l1 = get_l1_cache()
+        if self.config.get("ANALYTICS_ENABLED", True):
+            event_batcher = get_event_batcher() if self.config.get("EVENT_BATCHING.ENABLED") else None
+            self.analytics = AnalyticsTracker(self.config, event_batcher=event_batcher)
+        else:
+            self.analytics = NoopAnalyticsTracker()
 
     def get_cache_type(self) -> str:
         """Get the cache type for this decorator - to be overridden by subclasses"""
@@ -155,8 +179,13 @@ class BaseCacheDecorator:
 
         # Generate cache key with expiration date
         expiration_date = self._get_expiration_date(now)
-        cache_key = self.key_generator.generate_key(
-            func=func, args=args, kwargs=kwargs, expiration_date=expiration_date
+        if self.key_args is not None:
+            # Only the identifying subset selected by key_args is serialized and hashed
+            key_source_args, key_source_kwargs = (), {"key_args": self.key_args(*args, **kwargs)}
+        else:
+            key_source_args, key_source_kwargs = args, kwargs
+        cache_key, function_name, original_params = self.key_generator.build_key(
+            func=func, args=key_source_args, kwargs=key_source_kwargs, expiration_date=expiration_date
         )
         # Calculate timeout
         timeout = self._calculate_timeout(now)
@@ -168,22 +197,27 @@ class BaseCacheDecorator:
             # Fallback: Execute without caching
             return func(*args, **kwargs)
 
-        # Try cache hit using storage handler
-        cached_result = self.storage.get(cache_key)
+        # Try the process-local L1 first, then the cache backend
+        cached_result = self.l1.get(cache_key) if self.l1 is not None else None
+        if cached_result is None:
+            cached_result = self.storage.get(cache_key)
+            if cached_result is not None and self.l1 is not None:
+                self.l1.set(cache_key, cached_result, timeout)
 
         if cached_result is not None:
             # Track analytics using dedicated component
-            if self.config.should_track("PERFORMANCE"):
-                execution_time = (time.time() - start_time) * 1000
-            self.analytics.track_hit(
-                cache_backend=self.cache_name,
-                cache_key=cache_key,
-                function_name=self.key_generator.function_name,
-                original_params=self.key_generator.original_params,
-                timeout=timeout,
-                execution_time_ms=execution_time,
-                cache_type=self.get_cache_type(),
-            )
+            if self.analytics.enabled:
+                if self.config.should_track("PERFORMANCE"):
+                    execution_time = (time.time() - start_time) * 1000
+                self.analytics.track_hit(
+                    cache_backend=self.cache_name,
+                    cache_key=cache_key,
+                    function_name=function_name,
+                    original_params=original_params,
+                    timeout=timeout,
+                    execution_time_ms=execution_time,
+                    cache_type=self.get_cache_type(),
+                )
             return cached_result
 
         # CACHE MISS: Thundering Herd Protection
@@ -197,19 +231,22 @@ class BaseCacheDecorator:
                     result.add_post_render_callback(callback)
                 else:
                     self.storage.set(cache_key, result, timeout)
+                    if self.l1 is not None:
+                        self.l1.set(cache_key, result, timeout)
 
-                if self.config.should_track("PERFORMANCE"):
-                    execution_time = (time.time() - start_time) * 1000
                 # Track cache miss
-                self.analytics.track_miss(
-                    cache_backend=self.cache_name,
-                    cache_key=cache_key,
-                    function_name=self.key_generator.function_name,
-                    original_params=self.key_generator.original_params,
-                    timeout=timeout,
-                    execution_time_ms=execution_time,
-                    cache_type=self.get_cache_type(),
-                )
+                if self.analytics.enabled:
+                    if self.config.should_track("PERFORMANCE"):
+                        execution_time = (time.time() - start_time) * 1000
+                    self.analytics.track_miss(
+                        cache_backend=self.cache_name,
+                        cache_key=cache_key,
+                        function_name=function_name,
+                        original_params=original_params,
+                        timeout=timeout,
+                        execution_time_ms=execution_time,
+                        cache_type=self.get_cache_type(),
+                    )
                 return result
             finally:
                 self.storage.delete(lock_key)
@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Any
+from collections.abc import Callable
 from cron_converter import Cron
 from cron_converter.sub_modules.seeker import Seeker
 
@@ -35,14 +37,23 @@ class CronDecorator(BaseCacheDecorator):
         cron_expression (str): Cron expression in standard format (5 fields)
         timezone_name (str): Timezone for cron scheduling (default: "UTC")
         cache_backend (str): Django cache backend name (default: "default")
+        key_args (Callable): Optional selector returning the arguments used for the cache key
 
     Raises:
-        ValueError: If cron_expression is invalid
+        InvalidCronExpression: If cron_expression is invalid
     """
 
-    def __init__(self, cron_expression: str, timezone_name: str | None = None, cache_backend: str = "default") -> None:
+    def __init__(
+        self,
+        cron_expression: str,
+        timezone_name: str | None = None,
+        cache_backend: str = "default",
+        key_args: Callable[..., Any] | None = None,
+    ) -> None:
         self.cron_expression = cron_expression
-        super().__init__(timezone_name, cache_backend)
+        # Parse the expression once; each call only builds a schedule from the compiled fields
+        self._cron = self._compile_cron_expression(cron_expression)
+        super().__init__(timezone_name, cache_backend, key_args)
 
     def get_cache_type(self) -> str:
         """Return cache type for cron-based decorator"""
@@ -52,18 +63,23 @@ class CronDecorator(BaseCacheDecorator):
 
     def _get_expiration_date(self, now: datetime) -> datetime:
         """Calculate expiration date based on the next cron execution"""
-        return self._parse_cron_expression(self.cron_expression, now).next()
+        return self._schedule(now).next()
 
     def _calculate_timeout(self, now: datetime) -> int:
         """Calculate seconds until next cron execution"""
-        next_execution = self._parse_cron_expression(self.cron_expression, now).next()
+        next_execution = self._schedule(now).next()
         return int((next_execution - now).total_seconds())
 
+    def _schedule(self, now: datetime) -> Seeker:
+        """Build a schedule from the pre-parsed cron expression"""
+        try:
+            return self._cron.schedule(now)
+        except Exception as e:
+            raise InvalidCronExpression(e)
+
     @staticmethod
-    def _parse_cron_expression(cron_expression: str, now: datetime) -> Seeker:
+    def _compile_cron_expression(cron_expression: str) -> Cron:
         try:
-            cron = Cron(cron_expression)
-            schedule = cron.schedule(now)
-            return schedule
+            return Cron(cron_expression)
         except Exception as e:
             raise InvalidCronExpression(e)
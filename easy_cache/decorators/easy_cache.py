@@ -1,30 +1,56 @@
-from typing import Optional
+from collections.abc import Callable
+from typing import Any, Optional
 
 from django.core.cache import caches
+from django.utils.functional import SimpleLazyObject
 
 from easy_cache.decorators.cron import CronDecorator
 from easy_cache.decorators.time import TimeDecorator
 
 
 class EasyCacheDecorator:
+    __slots__ = ("_cache", "cache_name", "key_template")
+
     def __init__(self, key_template: str | None = None, cache_backend: str = "default") -> None:
         self.key_template = key_template or "{function_name}_{args_hash}"
         self.cache_name = cache_backend
-        self.cache = caches[cache_backend]
+        self._cache = None
+
+    @property
+    def cache(self) -> Any:
+        """Cache backend, resolved on first access"""
+        if self._cache is None:
+            self._cache = caches[self.cache_name]
+        return self._cache
 
     @classmethod
     def time_based(
-        cls, invalidate_at: str, timezone_name: str | None = None, cache_backend: str = "default"
+        cls,
+        invalidate_at: str,
+        timezone_name: str | None = None,
+        cache_backend: str = "default",
+        key_args: Callable[..., Any] | None = None,
     ) -> TimeDecorator:
         """Time-based cache invalidation - simplified implementation"""
-        return TimeDecorator(invalidate_at=invalidate_at, timezone_name=timezone_name, cache_backend=cache_backend)
+        return TimeDecorator(
+            invalidate_at=invalidate_at, timezone_name=timezone_name, cache_backend=cache_backend, key_args=key_args
+        )
 
     @classmethod
     def cron_based(
-        cls, cron_expression: str, timezone_name: str | None = None, cache_backend: str = "default"
+        cls,
+        cron_expression: str,
+        timezone_name: str | None = None,
+        cache_backend: str = "default",
+        key_args: Callable[..., Any] | None = None,
     ) -> CronDecorator:
         """Cron-based cache invalidation - supports cron syntax"""
-        return CronDecorator(cron_expression=cron_expression, timezone_name=timezone_name, cache_backend=cache_backend)
+        return CronDecorator(
+            cron_expression=cron_expression,
+            timezone_name=timezone_name,
+            cache_backend=cache_backend,
+            key_args=key_args,
+        )
 
 
-easy_cache = EasyCacheDecorator()
+easy_cache = SimpleLazyObject(EasyCacheDecorator)
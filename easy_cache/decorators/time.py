@@ -1,5 +1,7 @@
 import re
 from datetime import datetime, timedelta
+from typing import Any
+from collections.abc import Callable
 
 from easy_cache.decorators.base import BaseCacheDecorator
 from easy_cache.exceptions import InvalidTimeExpression
@@ -28,18 +30,25 @@ class TimeDecorator(BaseCacheDecorator):
         invalidate_at (str): Time in HH:MM format when cache should be invalidated
         timezone_name (str): Timezone for invalidation time (default: "UTC")
         cache_backend (str): Django cache backend name (default: "default")
+        key_args (Callable): Optional selector returning the arguments used for the cache key
 
     Raises:
         ValueError: If invalidate_at format is invalid
     """
 
-    def __init__(self, invalidate_at: str, timezone_name: str | None = None, cache_backend: str = "default") -> None:
+    def __init__(
+        self,
+        invalidate_at: str,
+        timezone_name: str | None = None,
+        cache_backend: str = "default",
+        key_args: Callable[..., Any] | None = None,
+    ) -> None:
         if not re.match(r"^([01]\d|2[0-3]):([0-5]\d)$", invalidate_at):
             raise InvalidTimeExpression(
                 f"Invalid time format! 'HH:MM' was expected, but '{invalidate_at}' was received."
             )
         self.invalidate_at = invalidate_at
-        super().__init__(timezone_name, cache_backend)
+        super().__init__(timezone_name, cache_backend, key_args)
 
     def get_cache_type(self) -> str:
         """Return cache type for time-based decorator"""
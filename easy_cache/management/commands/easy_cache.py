@@ -30,6 +30,9 @@ class Command(BaseCommand):
         clear_parser.add_argument(
             "--event-history", action="store_true", help="Clear only CacheEventHistory database records"
         )
+        clear_parser.add_argument(
+            "--expired", action="store_true", help="Delete expired CacheEntry database records in batches"
+        )
 
         # Analytics command
         analytics_parser = subparsers.add_parser("analytics", help="Show cache analytics")
@@ -72,16 +75,21 @@ class Command(BaseCommand):
         """Clear cache entries"""
         clear_cache_entries = options.get("cache_entries", False)
         clear_event_history = options.get("event_history", False)
+        clear_expired = options.get("expired", False)
 
         # Wenn keine spezifische Option gewählt wurde, zeige Hilfe
-        if not any([clear_cache_entries, clear_event_history]):
-            self.stdout.write(self.style.WARNING("Please select an option: --all, --cache-entries, or --event-history"))
+        if not any([clear_cache_entries, clear_event_history, clear_expired]):
+            self.stdout.write(
+                self.style.WARNING("Please select an option: --cache-entries, --event-history, or --expired")
+            )
             return
 
         if clear_cache_entries:
             self._clear_cache_entries()
         elif clear_event_history:
             self._clear_event_history()
+        elif clear_expired:
+            self._clear_expired_entries()
 
     def _clear_cache_entries(self):
         """Clear CacheEntry objects and their corresponding cache keys"""
@@ -108,6 +116,14 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.SUCCESS("No cache entries found to delete"))
 
+    def _clear_expired_entries(self):
+        """Delete expired CacheEntry objects in short batches"""
+        deleted = CacheEntry.objects.delete_expired()
+        if deleted:
+            self.stdout.write(self.style.SUCCESS(f"{deleted} expired cache entries successfully deleted"))
+        else:
+            self.stdout.write(self.style.SUCCESS("No expired cache entries found to delete"))
+
     def _clear_event_history(self):
         """Clear CacheEventHistory objects"""
         event_entries = CacheEventHistory.objects.all()
@@ -133,21 +149,22 @@ class Command(BaseCommand):
             entries = CacheEntry.objects.filter(created_at__gte=cutoff_date)
 
             if format_type == "json":
-                data = {
-                    "total_entries": entries.count(),
-                    "average_hit_rate": entries.aggregate(
-                        avg_hit_rate=models.Avg(
-                            models.Case(
-                                models.When(
-                                    hit_count__gt=0,
-                                    then=models.F("hit_count") * 100 / (models.F("hit_count") + models.F("miss_count")),
-                                ),
-                                default=0,
-                                output_field=models.FloatField(),
-                            )
+                summary = entries.aggregate(
+                    total_entries=models.Count("id"),
+                    avg_hit_rate=models.Avg(
+                        models.Case(
+                            models.When(
+                                hit_count__gt=0,
+                                then=models.F("hit_count") * 100 / (models.F("hit_count") + models.F("miss_count")),
+                            ),
+                            default=0,
+                            output_field=models.FloatField(),
                         )
-                    )["avg_hit_rate"]
-                    or 0,
+                    ),
+                )
+                data = {
+                    "total_entries": summary["total_entries"],
+                    "average_hit_rate": summary["avg_hit_rate"] or 0,
                 }
                 self.stdout.write(json.dumps(data, indent=2))
             else:
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('easy_cache', '0002_cacheentry_cache_type_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cacheentry',
+            name='easy_cache__expires_962cd6_idx',
+        ),
+        migrations.AddIndex(
+            model_name='cacheentry',
+            index=models.Index(fields=['cache_backend', 'expires_at'], include=('cache_key',), name='cache_backend_expiry_cov'),
+        ),
+    ]
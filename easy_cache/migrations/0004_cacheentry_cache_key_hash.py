@@ -0,0 +1,33 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_cache_key_hash(apps, schema_editor):
+    CacheEntry = apps.get_model("easy_cache", "CacheEntry")
+    entries = CacheEntry.objects.only("pk", "cache_key").iterator(chunk_size=1000)
+    batch = []
+    for entry in entries:
+        entry.cache_key_hash = hashlib.blake2b(entry.cache_key.encode(), digest_size=16).digest()
+        batch.append(entry)
+        if len(batch) >= 1000:
+            CacheEntry.objects.bulk_update(batch, ["cache_key_hash"])
+            batch = []
+    if batch:
+        CacheEntry.objects.bulk_update(batch, ["cache_key_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('easy_cache', '0003_cacheentry_backend_expiry_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cacheentry',
+            name='cache_key_hash',
+            field=models.BinaryField(blank=True, db_index=True, editable=False, max_length=16, null=True),
+        ),
+        migrations.RunPython(populate_cache_key_hash, migrations.RunPython.noop),
+    ]
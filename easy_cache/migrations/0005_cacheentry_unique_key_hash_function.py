@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('easy_cache', '0004_cacheentry_cache_key_hash'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='cacheentry',
+            constraint=models.UniqueConstraint(fields=('cache_key_hash', 'function_name'), name='uniq_key_hash_function'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('easy_cache', '0005_cacheentry_unique_key_hash_function'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cacheentry',
+            name='cache_key',
+            field=models.CharField(db_index=True, max_length=220),
+        ),
+        migrations.AlterField(
+            model_name='cacheeventhistory',
+            name='event_name',
+            field=models.CharField(db_index=True, max_length=64),
+        ),
+    ]
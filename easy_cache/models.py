@@ -1,15 +1,56 @@
+import hashlib
 import threading
 import time
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional
 
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import BooleanField, Case, ExpressionWrapper, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast, Now
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
 User = get_user_model()
 
 
+class CacheEntryQuerySet(models.QuerySet):
+    """QuerySet helpers for CacheEntry maintenance"""
+
+    def expired_batch(self, n: int = 1000, *, now: datetime | None = None, skip_locked: bool = False) -> list[int]:
+        """Primary keys of up to n entries expired before now, lowest first, optionally skipping locked rows"""
+        expired = self.filter(expires_at__lt=now or timezone.now()).order_by("pk")
+        if skip_locked:
+            expired = expired.select_for_update(skip_locked=True)
+        return list(expired.values_list("pk", flat=True)[:n])
+
+    def with_stats(self):
+        """Annotate total requests, hit percentage and expiry state computed by the database"""
+        total = F("hit_count") + F("miss_count")
+        return self.annotate(
+            total_requests=ExpressionWrapper(total, output_field=models.PositiveIntegerField()),
+            hit_percentage=Case(
+                When(Q(hit_count=0) & Q(miss_count=0), then=Value(0.0)),
+                default=Cast("hit_count", FloatField()) * Value(100.0) / total,
+                output_field=FloatField(),
+            ),
+            expired=ExpressionWrapper(Q(expires_at__lt=Now()), output_field=BooleanField()),
+        )
+
+    def delete_expired(self, batch_size: int = 1000) -> int:
+        """Delete expired entries in short per-batch transactions, skipping rows locked by other workers"""
+        skip_locked = connections[self.db].features.has_select_for_update_skip_locked
+        now = timezone.now()
+        deleted = 0
+
+        while True:
+            with transaction.atomic(using=self.db):
+                batch = self.expired_batch(batch_size, now=now, skip_locked=skip_locked)
+                if not batch:
+                    return deleted
+                # _raw_delete skips the collector, signals and per-instance overhead
+                deleted += self.model._base_manager.using(self.db).filter(pk__in=batch)._raw_delete(self.db)
+
+
 class CacheEntry(models.Model):
     """Model to track cache entries for analytics and management"""
 
@@ -21,7 +62,9 @@ class CacheEntry(models.Model):
     # Thread-local storage for per-thread time caching
     _thread_local = threading.local()
 
-    cache_key = models.CharField(max_length=255, db_index=True)
+    cache_key = models.CharField(max_length=220, db_index=True)
+    # 16-byte BLAKE2b digest of cache_key, used for narrow-index lookups
+    cache_key_hash = models.BinaryField(max_length=16, null=True, blank=True, editable=False, db_index=True)
     original_params = models.TextField(blank=True, null=True)
     function_name = models.CharField(max_length=255, db_index=True)
     cache_backend = models.CharField(max_length=100, default="default")
@@ -44,6 +87,8 @@ class CacheEntry(models.Model):
         null=True, blank=True, db_index=True, help_text="When this cache entry expires and should be considered invalid"
     )
 
+    objects = CacheEntryQuerySet.as_manager()
+
     @classmethod
     def _get_cached_current_time(cls):
         """Get cached current time to avoid multiple timezone.now() calls"""
@@ -59,19 +104,37 @@ class CacheEntry(models.Model):
     class Meta:
         verbose_name = "Cache Entry"
         verbose_name_plural = "Cache Entries"
+        constraints = [
+            models.UniqueConstraint(fields=["cache_key_hash", "function_name"], name="uniq_key_hash_function"),
+        ]
         indexes = [
             models.Index(fields=["function_name", "created_at"]),
             models.Index(fields=["cache_key", "last_accessed"]),
-            models.Index(fields=["expires_at"]),
             models.Index(fields=["hit_count", "miss_count"]),
             models.Index(fields=["cache_backend", "created_at"]),
             models.Index(fields=["last_accessed"]),
             models.Index(fields=["cache_type", "created_at"]),
+            # Covers expiry sweeps per backend; expires_at alone is already indexed via db_index
+            models.Index(
+                fields=["cache_backend", "expires_at"], include=["cache_key"], name="cache_backend_expiry_cov"
+            ),
         ]
 
     def __str__(self):
         return f"{self.get_cache_type_display()}: {self.function_name} ({self.cache_key[:30]}...)"
 
+    def save(self, *args, **kwargs):
+        self.cache_key_hash = self.hash_cache_key(self.cache_key)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "cache_key" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "cache_key_hash"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def hash_cache_key(cache_key: str) -> bytes:
+        """Raw 16-byte BLAKE2b digest of a cache key"""
+        return hashlib.blake2b(cache_key.encode(), digest_size=16).digest()
+
     @property
     def type(self):
         """Property to access cache type for cleaner API"""
@@ -93,20 +156,24 @@ class CacheEntry(models.Model):
 
     @property
     def is_expired(self) -> bool:
-        if not self.expires_at:
-            return False
-        return self.expires_at < self._get_cached_current_time()
+        return self.is_expired_at(self._get_cached_current_time())
 
     @property
     def time_left(self) -> timedelta:
         """Time remaining until cache expires"""
+        return self.time_left_at(self._get_cached_current_time())
+
+    def is_expired_at(self, now: datetime) -> bool:
+        """Whether the entry is expired at the given time (pass one `now` when checking many rows)"""
         if not self.expires_at:
-            return timedelta(0)
+            return False
+        return self.expires_at < now
 
-        current_time = self._get_cached_current_time()
-        if self.expires_at > current_time:
-            return self.expires_at - current_time
-        return timedelta(0)
+    def time_left_at(self, now: datetime) -> timedelta:
+        """Time remaining until cache expires, measured from the given time"""
+        if not self.expires_at or self.expires_at <= now:
+            return timedelta(0)
+        return self.expires_at - now
 
     @property
     def time_left_seconds(self) -> float:
@@ -144,7 +211,7 @@ class CacheEventHistory(models.Model):
         MISS = "miss", "Miss"
         ERROR = "error", "Error"
 
-    event_name = models.CharField(max_length=200, db_index=True)
+    event_name = models.CharField(max_length=64, db_index=True)
     event_type = models.CharField(max_length=50, choices=EventType.choices)
 
     cache_backend = models.CharField(max_length=100, default="default")
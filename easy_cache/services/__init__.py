@@ -1,9 +1,10 @@
 from easy_cache.services.key_generator import KeyGenerator
 from easy_cache.services.storage_handler import StorageHandler
-from easy_cache.services.analytics_tracker import AnalyticsTracker
+from easy_cache.services.analytics_tracker import AnalyticsTracker, NoopAnalyticsTracker
 
 __all__ = [
     "AnalyticsTracker",
+    "NoopAnalyticsTracker",
     "KeyGenerator",
     "StorageHandler",
 ]
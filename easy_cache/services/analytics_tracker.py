@@ -1,7 +1,7 @@
 import logging
 from datetime import timedelta
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from ..exceptions import InvalidCacheType
 from ..utils.validation import CacheInputValidator
@@ -12,8 +12,100 @@ logger = logging.getLogger(__name__)
 class AnalyticsTracker:
     """Simple synchronous analytics tracking"""
 
-    def __init__(self, config):
+    enabled = True
+
+    _ENTRY_DEFAULT_FIELDS = (
+        "cache_key",
+        "cache_backend",
+        "original_params",
+        "timeout",
+        "cache_type",
+        "expires_at",
+        "hit_count",
+        "miss_count",
+        "access_count",
+        "last_accessed",
+    )
+
+    def __init__(self, config, event_batcher=None):
         self.config = config
+        self.event_batcher = event_batcher
+
+    def _log_event(self, **fields) -> None:
+        """Write a CacheEventHistory row, via the event batcher if one is configured"""
+        from easy_cache.models import CacheEventHistory
+
+        if self.event_batcher is not None:
+            self.event_batcher.put(CacheEventHistory(**fields))
+        else:
+            CacheEventHistory.objects.create(**fields)
+
+    def _record_access(
+        self,
+        *,
+        cache_backend: str,
+        cache_key: str,
+        function_name: str,
+        original_params: str,
+        timeout: int,
+        cache_type: str,
+        hits: int = 0,
+        misses: int = 0,
+    ) -> None:
+        """Validate cache_type, then create the CacheEntry for a key or bump its counters"""
+        from easy_cache.models import CacheEntry
+        from django.db.models import F
+        from django.utils import timezone
+
+        if cache_type not in CacheEntry.CacheType.values:
+            raise InvalidCacheType
+
+        cache_key_hash = CacheEntry.hash_cache_key(cache_key)
+        now = timezone.now()
+        entry = CacheEntry(
+            cache_key=cache_key,
+            cache_key_hash=cache_key_hash,
+            function_name=function_name,
+            cache_backend=cache_backend,
+            original_params=original_params,
+            timeout=timeout,
+            cache_type=cache_type,
+            expires_at=now + timedelta(seconds=timeout) if timeout and timeout > 0 else None,
+            hit_count=hits,
+            miss_count=misses,
+            access_count=hits + misses,
+            last_accessed=now,
+        )
+
+        if self.event_batcher is not None:
+            # Batched mode: a read to find the row, counters are applied later by the writer thread
+            cache_entry, created = CacheEntry.objects.get_or_create(
+                cache_key_hash=cache_key_hash,
+                function_name=function_name,
+                defaults={field: getattr(entry, field) for field in self._ENTRY_DEFAULT_FIELDS},
+            )
+            if not created:
+                self.event_batcher.add_access(cache_entry.pk, hits=hits, misses=misses)
+            return
+
+        # Existing entries: one atomic UPDATE
+        entry_rows = CacheEntry.objects.filter(cache_key_hash=cache_key_hash, function_name=function_name)
+        increments = {
+            "hit_count": F("hit_count") + hits,
+            "miss_count": F("miss_count") + misses,
+            "access_count": F("access_count") + hits + misses,
+            "last_accessed": now,
+        }
+        if entry_rows.update(**increments):
+            return
+
+        # New entries: a single INSERT in a savepoint
+        try:
+            with transaction.atomic():
+                CacheEntry.objects.bulk_create([entry])
+        except IntegrityError:
+            # A concurrent first access inserted the row in between; add this access to its counters
+            entry_rows.update(**increments)
 
     def track_hit(
         self,
@@ -28,44 +120,23 @@ class AnalyticsTracker:
     ) -> None:
         """Track cache hit synchronously"""
 
-        from easy_cache.models import CacheEntry, CacheEventHistory
-        from django.db.models import F
-        from django.utils import timezone
+        from easy_cache.models import CacheEventHistory
 
         try:
             validated_cache_key = CacheInputValidator.validate_cache_key(cache_key)
 
-            # Validate cache_type
-            valid_types = list(CacheEntry.CacheType.values)
-            if cache_type not in valid_types:
-                raise InvalidCacheType
-
-            cache_entry, created = CacheEntry.objects.get_or_create(
+            self._record_access(
+                cache_backend=cache_backend,
                 cache_key=validated_cache_key,
                 function_name=function_name,
-                defaults={
-                    "cache_backend": cache_backend,
-                    "original_params": original_params,
-                    "timeout": timeout,
-                    "cache_type": cache_type,
-                    "expires_at": timezone.now() + timedelta(seconds=timeout) if timeout and timeout > 0 else None,
-                    "hit_count": 1,
-                    "access_count": 1,
-                    "last_accessed": timezone.now(),
-                },
+                original_params=original_params,
+                timeout=timeout,
+                cache_type=cache_type,
+                hits=1,
             )
 
-            if not created:
-                with transaction.atomic():
-                    entry_to_update = CacheEntry.objects.select_for_update().get(pk=cache_entry.pk)
-
-                    entry_to_update.hit_count = F("hit_count") + 1
-                    entry_to_update.access_count = F("access_count") + 1
-                    entry_to_update.last_accessed = timezone.now()
-                    entry_to_update.save(update_fields=["hit_count", "access_count", "last_accessed"])
-
             if self.config.should_log_event("CACHE_HITS"):
-                CacheEventHistory.objects.create(
+                self._log_event(
                     cache_backend=cache_backend,
                     event_name="cache_hit",
                     event_type=CacheEventHistory.EventType.HIT,
@@ -77,7 +148,7 @@ class AnalyticsTracker:
 
         except Exception as e:
             if self.config.should_log_event("CACHE_ERRORS"):
-                CacheEventHistory.objects.create(
+                self._log_event(
                     cache_backend=cache_backend,
                     event_name="tracking failed",
                     event_type=CacheEventHistory.EventType.ERROR,
@@ -101,44 +172,23 @@ class AnalyticsTracker:
     ) -> None:
         """Track cache miss"""
 
-        from easy_cache.models import CacheEntry, CacheEventHistory
-        from django.db.models import F
-        from django.utils import timezone
+        from easy_cache.models import CacheEventHistory
 
         try:
             validated_cache_key = CacheInputValidator.validate_cache_key(cache_key)
 
-            # Validate cache_type
-            valid_types = list(CacheEntry.CacheType.values)
-            if cache_type not in valid_types:
-                raise InvalidCacheType
-
-            cache_entry, created = CacheEntry.objects.get_or_create(
+            self._record_access(
+                cache_backend=cache_backend,
                 cache_key=validated_cache_key,
                 function_name=function_name,
-                defaults={
-                    "cache_backend": cache_backend,
-                    "original_params": original_params,
-                    "timeout": timeout,
-                    "cache_type": cache_type,
-                    "expires_at": timezone.now() + timedelta(seconds=timeout) if timeout and timeout > 0 else None,
-                    "miss_count": 1,
-                    "access_count": 1,
-                    "last_accessed": timezone.now(),
-                },
+                original_params=original_params,
+                timeout=timeout,
+                cache_type=cache_type,
+                misses=1,
             )
 
-            if not created:
-                with transaction.atomic():
-                    entry_to_update = CacheEntry.objects.select_for_update().get(pk=cache_entry.pk)
-
-                    entry_to_update.miss_count = F("miss_count") + 1
-                    entry_to_update.access_count = F("access_count") + 1
-                    entry_to_update.last_accessed = timezone.now()
-                    entry_to_update.save(update_fields=["miss_count", "access_count", "last_accessed"])
-
             if self.config.should_log_event("CACHE_MISSES"):
-                CacheEventHistory.objects.create(
+                self._log_event(
                     cache_backend=cache_backend,
                     event_name="cache_miss",
                     event_type=CacheEventHistory.EventType.MISS,
@@ -150,7 +200,7 @@ class AnalyticsTracker:
 
         except Exception as e:
             if self.config.should_log_event("CACHE_ERRORS"):
-                CacheEventHistory.objects.create(
+                self._log_event(
                     cache_backend=cache_backend,
                     event_name="tracking failed",
                     event_type=CacheEventHistory.EventType.ERROR,
@@ -160,3 +210,19 @@ class AnalyticsTracker:
                     original_params=original_params,
                 )
             logger.warning(f"Analytics tracking failed: {e}")
+
+
+class NoopAnalyticsTracker:
+    """Tracker used when ANALYTICS_ENABLED is False; records nothing"""
+
+    enabled = False
+
+    def __init__(self, config=None, event_batcher=None):
+        self.config = config
+        self.event_batcher = None
+
+    def track_hit(self, **kwargs) -> None:
+        pass
+
+    def track_miss(self, **kwargs) -> None:
+        pass
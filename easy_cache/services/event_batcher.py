@@ -0,0 +1,147 @@
+import atexit
+import logging
+import queue
+import threading
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class EventBatcher:
+    """Buffers cache events and CacheEntry counter deltas and writes them in bulk from a background thread"""
+
+    def __init__(self, maxsize: int = 10000, batch_size: int = 500, flush_interval: float = 0.5):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pending = {}
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def put(self, event) -> bool:
+        """Queue an unsaved event, dropping it if the queue is full"""
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def add_access(self, entry_id: int, *, hits: int = 0, misses: int = 0) -> None:
+        """Accumulate counter deltas for a CacheEntry until the next flush"""
+        self._ensure_started()
+        with self._lock:
+            pending = self._pending.setdefault(entry_id, [0, 0])
+            pending[0] += hits
+            pending[1] += misses
+
+    def flush(self) -> None:
+        """Write everything currently queued"""
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._write(batch)
+        self._write_counters()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="easy-cache-event-writer", daemon=True)
+                self._thread.start()
+
+    def _drain(self, first=None) -> list:
+        """Collect up to batch_size queued events without blocking"""
+        batch = [first] if first is not None else []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Wait for an event or the flush interval, then write queued events and pending counters"""
+        from django.db import connection
+
+        while True:
+            try:
+                first = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                first = None
+            if first is not None:
+                self._write(self._drain(first))
+            self._write_counters()
+            connection.close_if_unusable_or_obsolete()
+
+    def _write(self, batch: list) -> None:
+        """Insert a batch of events in a single transaction"""
+        from easy_cache.models import CacheEventHistory
+
+        try:
+            with transaction.atomic():
+                CacheEventHistory.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception as e:
+            logger.warning(f"Failed to write {len(batch)} cache events: {e}")
+
+    def _write_counters(self) -> None:
+        """Apply pending counter deltas, one UPDATE per distinct (hits, misses) shape"""
+        from django.db.models import F
+        from django.utils import timezone
+
+        from easy_cache.models import CacheEntry
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        by_delta = {}
+        for entry_id, (hits, misses) in pending.items():
+            by_delta.setdefault((hits, misses), []).append(entry_id)
+
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                for (hits, misses), entry_ids in by_delta.items():
+                    CacheEntry.objects.filter(pk__in=entry_ids).update(
+                        hit_count=F("hit_count") + hits,
+                        miss_count=F("miss_count") + misses,
+                        access_count=F("access_count") + hits + misses,
+                        last_accessed=now,
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to update {len(pending)} cache entry counters: {e}")
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_event_batcher() -> EventBatcher:
+    """Get the process-wide event batcher, flushing it at process exit"""
+    global _batcher
+
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                from easy_cache.config import get_config
+
+                config = get_config()
+                batcher = EventBatcher(
+                    maxsize=config.get("EVENT_BATCHING.QUEUE_SIZE", 10000),
+                    batch_size=config.get("EVENT_BATCHING.BATCH_SIZE", 500),
+                    flush_interval=config.get("EVENT_BATCHING.FLUSH_INTERVAL", 0.5),
+                )
+                # The writer thread drains on its interval; no request-end hook, so writes stay off the request path
+                atexit.register(batcher.flush)
+                _batcher = batcher
+
+    return _batcher
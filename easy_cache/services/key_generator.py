@@ -1,16 +1,221 @@
 """Simple Cache Key Generation System"""
 
+import dataclasses
 import hashlib
 import inspect
+import ipaddress
 import json
-from datetime import datetime
+import math
+import pathlib
+import sys
+import uuid
+import weakref
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from collections.abc import Callable
 
+from django.http import HttpRequest
+
 from easy_cache.config import get_config
 from easy_cache.exceptions import CacheKeyValidationError, UncachableArgumentError
 
+try:
+    import orjson
+
+    # Dataclasses and datetimes go through _json_default so their key representation stays unchanged
+    ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=4096)
+def _function_name(func: Callable) -> str:
+    """Dotted module path of func, computed once per function"""
+    # Interned so queued events and tracked entries share one string per decorated function
+    return sys.intern(f"{func.__module__}.{func.__qualname__}")
+
+
+@lru_cache(maxsize=256)
+def _format_expiration(expiration_date: datetime, tzinfo: Any) -> str:
+    """
+    Format an expiration date as 20250905_143000 (YYYYMMDD_HHMMSS).
+
+    Every call within a cron/time interval shares the same expiration date, so the result is memoized.
+    tzinfo is part of the cache key because aware datetimes for the same instant compare equal
+    across timezones while their wall-clock fields differ.
+    """
+    d = expiration_date
+    # %-formatting the fields skips strftime's format parsing
+    return "%04d%02d%02d_%02d%02d%02d" % (d.year, d.month, d.day, d.hour, d.minute, d.second)
+
+
+# Exact types whose JSON form depends only on their value; floats are left out because 0.0 and -0.0
+# compare equal but serialize differently
+_ATOMIC_TYPES = frozenset({str, int, bool, type(None)})
+# Longer strings rarely repeat and would only bloat the memo
+_ATOMIC_STR_MAX_LENGTH = 256
+
+
+@lru_cache(maxsize=10_000)
+def _serialize_atomic(value_type: type, value: Any) -> str:
+    """JSON form of a plain scalar, memoized by (type, value) so True and 1 stay distinct"""
+    if value_type is int:
+        return str(value)
+    if value_type is bool:
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if value_type is str and value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+        return f'"{value}"'
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # e.g. lone surrogates, which orjson rejects and the stdlib encoder escapes
+            pass
+    return json.dumps(value)
+
+
+def _orjson_matches_stdlib(value: Any) -> bool:
+    """
+    Whether orjson encodes value exactly like the stdlib encoder.
+
+    orjson writes Enums as their bare value and NaN/Infinity as null, which would make
+    f(Color.RED), f(1) and f(float("nan")), f(None) share keys, and it passes float and tuple
+    subclasses (including namedtuples) to default instead of encoding their value. Only exact
+    dicts, lists and tuples are walked; any subclass takes the stdlib path. Values handed to _json_default
+    are checked again on the way out (see KeyGenerator._orjson_default).
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is dict:
+        return all(map(_orjson_matches_stdlib, value.values()))
+    if value_type is list or value_type is tuple:
+        return all(map(_orjson_matches_stdlib, value))
+    # Enums and subclasses of JSON types (namedtuples, float subclasses, ...): orjson hands some of
+    # them to default, where they would lose their value or fall back to a repr with an address
+    return not isinstance(value, (Enum, str, int, float, tuple, list, dict))
+
+
+# Characters that break cache backends; single-character `in` checks are memchr scans, which beat
+# str.translate or set intersection on keys capped at 250 characters
+_PROBLEMATIC_KEY_CHARS = ("\n", "\r", "\0")
+
+
+@lru_cache(maxsize=512)
+def _dataclass_hash_fields(cls: type) -> tuple[str, ...] | None:
+    """Names of the fields of a dataclass that take part in hashing, or None for other classes"""
+    if not dataclasses.is_dataclass(cls):
+        return None
+    # Respect field(hash=False); include if hash is True or None
+    return tuple(field.name for field in dataclasses.fields(cls) if field.hash is not False)
+
+
+@lru_cache(maxsize=4096)
+def _datetime_isoformat(value: datetime, tzinfo: Any, fold: int) -> str:
+    """
+    ISO representation of a datetime, memoized.
+
+    tzinfo keeps equal instants in different zones apart; fold keeps the two occurrences of a
+    wall-clock time repeated at a DST change apart, since they compare equal within one zone.
+    """
+    return value.isoformat(timespec="microseconds")
+
+
+def _frozenset_sort_key(value: Any) -> tuple[str, str]:
+    """Order frozenset members of mixed types by type name, then string form"""
+    return type(value).__name__, str(value)
+
+
+def _sorted_frozenset(value: frozenset) -> list:
+    """Members of a frozenset in a deterministic order"""
+    return sorted(value, key=_frozenset_sort_key)
+
+
+# Exact-type serializers for leaves the encoders hand to _json_default; each matches what the
+# generic checks in _json_default would produce for that type
+_DEFAULT_BY_TYPE: dict[type, Callable[[Any], Any]] = {
+    datetime: lambda obj: _datetime_isoformat(obj, obj.tzinfo, obj.fold),
+    date: str,
+    time: str,
+    Decimal: str,
+    uuid.UUID: str,
+    frozenset: _sorted_frozenset,
+    # Slotted stdlib values without a JSON form; all of them end in the str() fallback
+    timedelta: str,
+    complex: str,
+    bytes: str,
+    bytearray: str,
+    pathlib.PurePosixPath: str,
+    pathlib.PureWindowsPath: str,
+    pathlib.PosixPath: str,
+    pathlib.WindowsPath: str,
+    ipaddress.IPv4Address: str,
+    ipaddress.IPv6Address: str,
+}
+
+# Argument kinds handled by _simple_params
+_SCALAR, _COLLECTION, _MODEL, _REQUEST = "scalar", "collection", "model", "request"
+# Exact builtin types resolve with one dict lookup instead of attribute probing
+_KIND_BY_TYPE = {
+    str: _SCALAR,
+    int: _SCALAR,
+    float: _SCALAR,
+    bool: _SCALAR,
+    type(None): _SCALAR,
+    dict: _COLLECTION,
+    list: _COLLECTION,
+    tuple: _COLLECTION,
+    set: _COLLECTION,
+}
+_MISSING = object()
+
+
+def _arg_kind(arg: Any) -> str:
+    """Classify a positional argument for key serialization"""
+    kind = _KIND_BY_TYPE.get(type(arg))
+    if kind is not None:
+        return kind
+    if getattr(arg, "pk", _MISSING) is not _MISSING:
+        return _MODEL
+    # Request-like wrappers (e.g. DRF's Request) expose GET without subclassing HttpRequest
+    if isinstance(arg, HttpRequest) or (hasattr(arg, "GET") and hasattr(arg.GET, "items")):
+        return _REQUEST
+    if isinstance(arg, (dict, list, tuple, set)):
+        return _COLLECTION
+    return _SCALAR
+
+
+# Per-function result of the signature inspection; weak keys so discarded functions are not kept alive
+_HAS_SELF_CACHE = weakref.WeakKeyDictionary()
+
+
+def _has_self_parameter(func: Callable) -> bool:
+    """Return whether the first parameter of func is named 'self' (cached per function)"""
+    try:
+        return _HAS_SELF_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    try:
+        params = list(inspect.signature(func).parameters)
+        has_self = bool(params) and params[0] == "self"
+    except Exception:
+        has_self = False
+
+    try:
+        _HAS_SELF_CACHE[func] = has_self
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins); just skip caching
+        pass
+    return has_self
+
 
 class KeyGenerator:
     """
@@ -29,11 +234,22 @@ class KeyGenerator:
         """Initialize KeyGenerator."""
         self.config = get_config()
         self.prefix: str = prefix
-        self.function_name: str | None = None
-        self.original_params: str | None = None
+        self._key_heads: dict[str, str] = {}
 
         # Load exclude_types from config
         self.exclude_types = tuple(self.config.get("DEFAULT_EXCLUDE_TYPES", ()))
+        # Exclusion decision per concrete type, filled lazily by _should_exclude_value
+        self._excluded_by_type: dict[type, bool] = {}
+        # Scalar value types that never need filtering; a dict holding only these is passed through as is
+        self._flat_value_types = frozenset(
+            t for t in (str, int, float, bool, type(None)) if not issubclass(t, self.exclude_types)
+        )
+
+        # Digest size in bytes for the BLAKE2b parameter hash
+        self.hash_digest_size = self.config.get("KEY_HASH_BITS", 64) // 8
+
+        # Values longer than this are replaced by a short digest in _process_value
+        self.max_value_length = self.config.get("MAX_VALUE_LENGTH")
 
     def generate_key(
         self,
@@ -44,64 +260,79 @@ class KeyGenerator:
         expiration_date: datetime = None,
     ) -> str:
         """Generate cache key with optional expiration date: Classname_methodname_params_expires_timestamp"""
+        cache_key, _, _ = self.build_key(func=func, args=args, kwargs=kwargs, expiration_date=expiration_date)
+        return cache_key
 
-        self.function_name = f"{func.__module__}.{func.__qualname__}"
-        self.original_params = self._simple_params(func=func, args=args, kwargs=kwargs)
+    def build_key(
+        self,
+        *,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        expiration_date: datetime = None,
+    ) -> tuple[str, str, str]:
+        """
+        Generate the cache key together with the parts it was built from.
+
+        Keeps no per-call state on the instance, so one KeyGenerator can be shared across threads.
 
-        hashed_params = hashlib.sha256(self.original_params.encode()).hexdigest()[:16]
-        key_parts = [self.function_name, hashed_params]
+        Returns:
+            Tuple of (cache_key, function_name, original_params)
+        """
+        function_name = _function_name(func)
+        original_params = self._simple_params(func=func, args=args, kwargs=kwargs)
+
+        hashed_params = hashlib.blake2b(original_params.encode(), digest_size=self.hash_digest_size).hexdigest()
+
+        # "prefix:module.qualname_" is fixed per function, so it is only formatted once
+        key_head = self._key_heads.get(function_name)
+        if key_head is None:
+            key_head = self._key_heads[function_name] = f"{self.prefix}:{function_name}_"
 
         # Add expiration date to key if provided (takes precedence over period)
         if expiration_date:
-            # Format: expires_20250905_143000 (YYYYMMDD_HHMMSS)
-            expires_part = f"{expiration_date.strftime('%Y%m%d_%H%M%S')}"
-            key_parts.append(expires_part)
+            cache_key = f"{key_head}{hashed_params}_{_format_expiration(expiration_date, expiration_date.tzinfo)}"
+        else:
+            cache_key = key_head + hashed_params
 
-        # Join with underscores and add prefix
-        cache_key = "_".join(part for part in key_parts if part)
-        return f"{self.prefix}:{cache_key}"
+        return cache_key, function_name, original_params
 
     def _simple_params(self, *, func: Callable, args: tuple, kwargs: dict) -> str:
         """Processes and serializes simple parameters from a function's arguments, filtering by allowed types and constraints."""
         # Check if this is a method (has 'self' parameter)
-        try:
-            sig = inspect.signature(func)
-            params = list(sig.parameters.keys())
-            has_self = params and params[0] == "self"
-        except Exception:
-            has_self = False
+        has_self = _has_self_parameter(func)
 
         # Filter out 'self' for methods
         filtered_args = args[1:] if has_self and args else args
 
         # Serialize all values using JSON with custom encoder
         simple_values = []
+        append = simple_values.append
 
         # Process args
-        for i, arg in enumerate(filtered_args):
-            if hasattr(arg, "pk"):  # Handle Django Models specially
-                simple_values.append(f"{arg.__class__.__name__}:{arg.pk}")
+        for arg in filtered_args:
+            kind = _arg_kind(arg)
+            if kind is _MODEL:  # Handle Django Models specially
+                append(f"{arg.__class__.__name__}:{arg.pk}")
 
-            elif hasattr(arg, "GET") and hasattr(arg.GET, "items"):  # Handle Django Request
+            elif kind is _REQUEST:  # Handle Django Request
                 for key, value in arg.GET.items():
                     try:
-                        serialized = json.dumps(
-                            value, sort_keys=True, separators=(",", ":"), default=self._json_default
-                        )
+                        serialized = self._dumps(value)
                         safe_value = self._process_value(serialized)
                         if safe_value:
                             param_str = f"{key}={safe_value}"
-                            simple_values.append(param_str)
+                            append(param_str)
                     except (TypeError, ValueError) as e:
                         raise UncachableArgumentError(
                             f"Request parameter '{key}' of type '{type(value).__name__}' for function "
                             f"'{func.__qualname__}' is not automatically cachable: {e}"
                         )
-            elif isinstance(arg, (dict, list, tuple, set)):
+            elif kind is _COLLECTION:
                 # Handle collections using deterministic JSON serialization
                 try:
                     serialized = self._serialize_collection(arg, for_display=False)
-                    simple_values.append(serialized)
+                    append(serialized)
                 except (TypeError, ValueError) as e:
                     raise UncachableArgumentError(
                         f"Argument of type '{type(arg).__name__}' for function "
@@ -110,10 +341,10 @@ class KeyGenerator:
             else:
                 # Handle all other types (str, int, float, bool, None, objects) using JSON serialization
                 try:
-                    serialized = json.dumps(arg, sort_keys=True, separators=(",", ":"), default=self._json_default)
+                    serialized = self._dumps(arg)
                     safe_value = self._process_value(serialized)
                     if safe_value:
-                        simple_values.append(safe_value)
+                        append(safe_value)
                 except (TypeError, ValueError) as e:
                     raise UncachableArgumentError(
                         f"Argument of type '{type(arg).__name__}' for function "
@@ -128,7 +359,7 @@ class KeyGenerator:
                     try:
                         serialized = self._serialize_collection(value, for_display=False)
                         param_str = f"{key}={serialized}"
-                        simple_values.append(param_str)
+                        append(param_str)
                     except (TypeError, ValueError) as e:
                         raise UncachableArgumentError(
                             f"Keyword argument '{key}' of type '{type(value).__name__}' for function "
@@ -137,13 +368,11 @@ class KeyGenerator:
                 else:
                     # Handle all other types using JSON serialization
                     try:
-                        serialized = json.dumps(
-                            value, sort_keys=True, separators=(",", ":"), default=self._json_default
-                        )
+                        serialized = self._dumps(value)
                         safe_value = self._process_value(serialized)
                         if safe_value:
                             param_str = f"{key}={safe_value}"
-                            simple_values.append(param_str)
+                            append(param_str)
                     except (TypeError, ValueError) as e:
                         raise UncachableArgumentError(
                             f"Keyword argument '{key}' of type '{type(value).__name__}' for function "
@@ -155,6 +384,40 @@ class KeyGenerator:
 
         return result
 
+    def _dumps(self, value: Any) -> str:
+        """
+        Compact, key-sorted JSON for a single parameter value.
+
+        Uses orjson when available and falls back to the stdlib encoder for values orjson
+        rejects (e.g. integers above 64 bits, non-string dict keys, circular references) or
+        encodes differently (Enums anywhere in the value, NaN and infinities).
+        Plain scalars are served from a memo shared by all generators.
+        """
+        value_type = type(value)
+        if value_type in _ATOMIC_TYPES and (value_type is not str or len(value) <= _ATOMIC_STR_MAX_LENGTH):
+            return _serialize_atomic(value_type, value)
+
+        if orjson is not None:
+            try:
+                use_orjson = _orjson_matches_stdlib(value)
+            except RecursionError:
+                # Circular or very deep values; the stdlib encoder reports cycles
+                use_orjson = False
+            if use_orjson:
+                try:
+                    return orjson.dumps(value, default=self._orjson_default, option=ORJSON_OPTIONS).decode()
+                except TypeError:
+                    pass
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=self._json_default)
+
+    def _orjson_default(self, obj: Any) -> Any:
+        """_json_default for orjson; rejects results orjson would encode differently from the stdlib"""
+        result = self._json_default(obj)
+        if not _orjson_matches_stdlib(result):
+            # orjson re-raises errors from default as TypeError, which sends _dumps to the stdlib encoder
+            raise TypeError("value needs the stdlib encoder")
+        return result
+
     def _should_exclude_value(self, value: Any) -> bool:
         """
         Determine if a value should be excluded from cache key generation based on its type.
@@ -165,36 +428,59 @@ class KeyGenerator:
         Returns:
             True if value should be excluded, False otherwise
         """
-        return isinstance(value, self.exclude_types)
-
-    def _filter_dict_for_cache(self, data: dict) -> dict:
+        # One dict probe per value; the subclass check only runs the first time a type is seen
+        value_type = type(value)
+        excluded = self._excluded_by_type.get(value_type)
+        if excluded is None:
+            excluded = self._excluded_by_type[value_type] = issubclass(value_type, self.exclude_types)
+        return excluded
+
+    def _filter_dict_for_cache(self, data: dict, active: set[int] | None = None) -> dict:
         """
         Filter dictionary to remove values with unstable types (recursively).
 
         Args:
             data: Dictionary to filter
+            active: ids of the dicts currently being filtered above this one (used to detect cycles)
 
         Returns:
             Filtered dictionary with unstable types removed at all levels
+
+        Raises:
+            ValueError: If the dictionary contains itself
         """
+        if active is None:
+            active = set()
+        data_id = id(data)
+        if data_id in active:
+            raise ValueError("Circular reference detected")
+        active.add(data_id)
+
+        # Bound once per level instead of looked up for every value
+        should_exclude = self._should_exclude_value
+        filter_dict = self._filter_dict_for_cache
+
         filtered = {}
-        for key, value in data.items():
-            # Skip values with unstable types
-            if self._should_exclude_value(value):
-                continue
-
-            # Recursively filter nested dicts
-            if isinstance(value, dict):
-                filtered[key] = self._filter_dict_for_cache(value)
-            # Recursively filter dicts in lists
-            elif isinstance(value, list):
-                filtered[key] = [
-                    self._filter_dict_for_cache(item) if isinstance(item, dict) else item
-                    for item in value
-                    if not self._should_exclude_value(item)
-                ]
-            else:
-                filtered[key] = value
+        try:
+            for key, value in data.items():
+                # Skip values with unstable types
+                if should_exclude(value):
+                    continue
+
+                # Recursively filter nested dicts
+                if isinstance(value, dict):
+                    filtered[key] = filter_dict(value, active)
+                # Recursively filter dicts in lists
+                elif isinstance(value, list):
+                    filtered[key] = [
+                        filter_dict(item, active) if isinstance(item, dict) else item
+                        for item in value
+                        if not should_exclude(item)
+                    ]
+                else:
+                    filtered[key] = value
+        finally:
+            active.discard(data_id)
 
         return filtered
 
@@ -214,13 +500,18 @@ class KeyGenerator:
         Returns:
             A JSON-serializable representation
         """
+        # Common leaf types resolve with one lookup on the exact type
+        serializer = _DEFAULT_BY_TYPE.get(type(obj))
+        if serializer is not None:
+            return serializer(obj)
+
         # Handle Enum types with stable serialization
         if isinstance(obj, Enum):
             return f"{obj.__class__.__name__}.{obj.name}"
 
         # Handle frozensets deterministically (sort for consistent ordering)
         if isinstance(obj, frozenset):
-            return sorted(list(obj), key=lambda x: (type(x).__name__, str(x)))
+            return _sorted_frozenset(obj)
 
         # Handle Django models - use class name and primary key (stable identifier)
         if hasattr(obj, "pk") and hasattr(obj, "__class__"):
@@ -228,27 +519,19 @@ class KeyGenerator:
 
         # Handle datetime objects with consistent formatting
         if isinstance(obj, datetime):
-            return obj.isoformat(timespec="microseconds")
+            return _datetime_isoformat(obj, obj.tzinfo, obj.fold)
 
         # For dataclasses, use their dict representation (already excludes methods)
-        try:
-            import dataclasses
-
-            if dataclasses.is_dataclass(obj):
-                # Respect field(hash=False) by filtering
-                fields_dict = {}
-                for field in dataclasses.fields(obj):
-                    if field.hash is not False:  # Include if hash is True or None
-                        fields_dict[field.name] = getattr(obj, field.name)
-                return fields_dict
-        except ImportError:
-            pass
+        field_names = _dataclass_hash_fields(obj if isinstance(obj, type) else type(obj))
+        if field_names is not None:
+            return {name: getattr(obj, name) for name in field_names}
 
         # Fallback for custom objects: serialize their __dict__ with auto-exclude
         if hasattr(obj, "__dict__"):
             # Get object's dict and filter to remove unstable types
             obj_dict = {key: value for key, value in obj.__dict__.items() if not key.startswith("_")}
-            obj_dict = self._filter_dict_for_cache(obj_dict)
+            if self.exclude_types:
+                obj_dict = self._filter_dict_for_cache(obj_dict)
             return obj_dict
 
         # Last resort: use string representation (no memory address)
@@ -265,29 +548,35 @@ class KeyGenerator:
             for_display: If True, uses pretty-printed JSON for human readability in database.
                         If False, uses compact format for cache keys.
         """
+        # Empty containers (e.g. a GET request without query params) need no filtering or encoding
+        if not obj:
+            return "{}" if isinstance(obj, dict) else "[]"
+
         # Convert sets, frozensets, and tuples to lists for JSON serialization
         if isinstance(obj, (set, frozenset)):
             obj = sorted(list(obj), key=lambda x: (type(x).__name__, str(x)))
         elif isinstance(obj, tuple):
             obj = list(obj)
 
-        # For dictionaries, apply filtering and sort keys for deterministic output
-        if isinstance(obj, dict):
-            # Apply filter to remove dynamic fields
-            obj = self._filter_dict_for_cache(obj)
-            obj = dict(sorted(obj.items()))
+        # For dictionaries, apply filtering; both encoders sort keys for deterministic output
+        if isinstance(obj, dict) and self.exclude_types:
+            # Apply filter to remove dynamic fields (nothing to walk for when no types are excluded,
+            # or when every value is a plain scalar that is kept anyway)
+            flat_value_types = self._flat_value_types
+            if not all(type(value) in flat_value_types for value in obj.values()):
+                obj = self._filter_dict_for_cache(obj)
 
         # Serialize to JSON with sorted keys using custom encoder
         if for_display:
             # Pretty format for human readability in database/admin
             json_str = json.dumps(obj, sort_keys=True, indent=2, default=self._json_default)
         else:
-            # Compact format for cache keys
-            json_str = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=self._json_default)
+            # Compact format for cache keys (orjson when available)
+            json_str = self._dumps(obj)
 
         # Hash if too long for cache key efficiency (only for cache keys, not display)
         if not for_display and len(json_str) > self.MAX_VALUE_LENGTH:
-            return hashlib.sha256(json_str.encode()).hexdigest()[:16]
+            return hashlib.blake2b(json_str.encode(), digest_size=8).hexdigest()
 
         return json_str
 
@@ -299,8 +588,8 @@ class KeyGenerator:
         str_value = str(value)
 
         # Hash if too long for cache key efficiency
-        if len(str_value) > self.config.get("MAX_VALUE_LENGTH"):
-            value_hash = hashlib.sha256(str_value.encode()).hexdigest()[:8]
+        if len(str_value) > self.max_value_length:
+            value_hash = hashlib.blake2b(str_value.encode(), digest_size=4).hexdigest()
             return f"_{value_hash}"
 
         # Minimal cleaning - only chars that break cache backends
@@ -318,7 +607,6 @@ class KeyGenerator:
             raise CacheKeyValidationError(f"Cache key too long: {len(cache_key)} chars")
 
         # Only check for characters that actually break cache backends
-        problematic_chars = ["\n", "\r", "\0"]
-        for char in problematic_chars:
+        for char in _PROBLEMATIC_KEY_CHARS:
             if char in cache_key:
                 raise CacheKeyValidationError(f"Cache key contains problematic character: {repr(char)}")
@@ -0,0 +1,76 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+_MISSING = object()
+
+
+class L1Cache:
+    """
+    Small process-local LRU cache consulted before the Django cache backend.
+
+    Values are stored pickled and unpickled on every get, so like a backend hit each caller
+    receives its own copy and mutating a result cannot change what later hits return.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value if present and not expired"""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires, payload = item
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return pickle.loads(payload)
+
+    def set(self, key: str, value: Any, timeout: int) -> None:
+        """Store a value for timeout seconds, evicting the least recently used entry when full"""
+        if timeout is None or timeout <= 0:
+            return
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+_l1 = None
+_l1_lock = threading.Lock()
+
+
+def get_l1_cache() -> L1Cache | None:
+    """Get the process-wide L1 cache, or None when L1_SIZE is 0"""
+    global _l1
+
+    if _l1 is None:
+        with _l1_lock:
+            if _l1 is None:
+                from easy_cache.config import get_config
+
+                size = get_config().get("L1_SIZE", 0)
+                if not size:
+                    return None
+                _l1 = L1Cache(maxsize=size)
+
+    return _l1
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Union
 
 
+@lru_cache(maxsize=1024)
 def format_duration_ms(duration_ms: int | float) -> str:
     """
     Format duration in milliseconds to a human-readable string.
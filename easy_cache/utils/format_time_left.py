@@ -3,8 +3,9 @@ Utilities for formatting time-related information.
 """
 
 from datetime import timedelta
+from functools import lru_cache
 
-from django.utils.translation import ngettext
+from django.utils.translation import get_language, ngettext
 
 
 def format_time_left(time_delta: timedelta | int | float) -> str:
@@ -30,8 +31,12 @@ def format_time_left(time_delta: timedelta | int | float) -> str:
     if isinstance(time_delta, (int, float)):
         time_delta = timedelta(seconds=time_delta)
 
-    total_seconds = int(time_delta.total_seconds())
+    return _format_seconds(int(time_delta.total_seconds()), get_language())
 
+
+@lru_cache(maxsize=1024)
+def _format_seconds(total_seconds: int, language: str | None) -> str:
+    """Memoized formatting of whole seconds; the active language is part of the key since ngettext depends on it"""
     # Handle edge cases
     if total_seconds <= 0:
         return "expired"
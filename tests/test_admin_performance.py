@@ -24,17 +24,16 @@ class TestAdminPerformance(TestCase):
         """Test that admin list view performs well with many entries"""
         admin = CacheEntryAdmin(CacheEntry, AdminSite())
 
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
         # Simulate admin list view
         queryset = admin.get_queryset(None)
         list(queryset)  # Force evaluation
 
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_ns = time.perf_counter_ns() - t0
 
         # Should complete in under 100ms for 100 entries
-        assert execution_time < 0.1, f"Admin list too slow: {execution_time:.3f}s"
+        assert execution_ns < 100_000_000, f"Admin list too slow: {execution_ns / 1e9:.3f}s"
 
     def test_queryset_optimization(self):
         """Test that queryset is optimized with annotations"""
@@ -54,14 +53,13 @@ class TestAdminPerformance(TestCase):
         # Warm up to avoid cold start effects
         admin.expires_at_display(entry)
 
-        start_time = time.perf_counter()
+        t0 = time.perf_counter_ns()
 
         # Call display method multiple times
         for _ in range(100):
             admin.expires_at_display(entry)
 
-        end_time = time.perf_counter()
-        execution_time = end_time - start_time
+        execution_ns = time.perf_counter_ns() - t0
 
         # More reasonable threshold - 100ms for 100 calls (1ms per call)
-        assert execution_time < 0.1, f"expires_at_display too slow: {execution_time:.3f}s for 100 calls"
+        assert execution_ns < 100_000_000, f"expires_at_display too slow: {execution_ns / 1e9:.3f}s for 100 calls"
@@ -10,6 +10,12 @@ from easy_cache.services.key_generator import KeyGenerator
 class AutoExcludeTestCase(TestCase):
     """Test auto-exclude feature that automatically filters unstable types"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # KeyGenerator keeps no per-call state, so one instance serves every test
+        cls.kg = KeyGenerator()
+
     @staticmethod
     def _test_function(data):
         return data
@@ -20,44 +26,36 @@ class AutoExcludeTestCase(TestCase):
 
     def test_auto_exclude_datetime_type(self):
         """Test that datetime values are auto-excluded regardless of field name"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "any_field_name": datetime.now(timezone.utc)}
         dict2 = {"id": 1, "any_field_name": datetime.now(timezone.utc)}
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "datetime values should be auto-excluded by type")
 
     def test_auto_exclude_date_type(self):
         """Test that date values are auto-excluded"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "some_date": date(2025, 1, 1)}
         dict2 = {"id": 1, "some_date": date(2025, 1, 2)}
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "date values should be auto-excluded by type")
 
     def test_auto_exclude_time_type(self):
         """Test that time values are auto-excluded"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "some_time": time(12, 0, 0)}
         dict2 = {"id": 1, "some_time": time(13, 0, 0)}
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "time values should be auto-excluded by type")
 
     def test_auto_exclude_multiple_datetime_fields(self):
         """Test that multiple datetime fields are auto-excluded"""
-        kg = KeyGenerator()
-
         now1 = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         now2 = datetime(2025, 1, 1, 13, 0, 0, tzinfo=timezone.utc)
 
@@ -70,31 +68,41 @@ class AutoExcludeTestCase(TestCase):
             "last_modified": now2,  # Different
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "All datetime fields should be auto-excluded")
 
+    def test_auto_exclude_datetime_subclass(self):
+        """Test that subclasses of excluded types are excluded as well"""
+
+        class CustomDateTime(datetime):
+            pass
+
+        dict1 = {"id": 1, "seen_at": CustomDateTime(2025, 1, 1, tzinfo=timezone.utc)}
+        dict2 = {"id": 1, "seen_at": CustomDateTime(2025, 1, 2, tzinfo=timezone.utc)}
+
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+
+        self.assertEqual(key1, key2, "datetime subclasses should be auto-excluded")
+
     # ==========================================
     # AUTO-EXCLUDE: UUID Type
     # ==========================================
 
     def test_auto_exclude_uuid_type(self):
         """Test that UUID values are auto-excluded"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "request_id": uuid.uuid4()}
         dict2 = {"id": 1, "request_id": uuid.uuid4()}
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "UUID values should be auto-excluded by type")
 
     def test_auto_exclude_multiple_uuid_fields(self):
         """Test that multiple UUID fields are auto-excluded"""
-        kg = KeyGenerator()
-
         dict1 = {"user_id": 123, "request_id": uuid.uuid4(), "session_id": uuid.uuid4(), "trace_id": uuid.uuid4()}
         dict2 = {
             "user_id": 123,
@@ -103,8 +111,8 @@ class AutoExcludeTestCase(TestCase):
             "trace_id": uuid.uuid4(),  # Different
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "All UUID fields should be auto-excluded")
 
@@ -126,10 +134,12 @@ class AutoExcludeTestCase(TestCase):
         dict1 = {"id": 1, "timestamp": datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)}
         dict2 = {"id": 1, "timestamp": datetime(2025, 1, 1, 13, 0, 0, tzinfo=timezone.utc)}
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        with patch.object(kg, "_filter_dict_for_cache") as mock_filter:
+            key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+            key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertNotEqual(key1, key2, "With empty exclude types, all fields should be included")
+        mock_filter.assert_not_called()
 
     # ==========================================
     # AUTO-EXCLUDE: Non-Dynamic Fields Included
@@ -137,8 +147,6 @@ class AutoExcludeTestCase(TestCase):
 
     def test_stable_fields_are_included(self):
         """Test that stable fields are still included in cache key"""
-        kg = KeyGenerator()
-
         dict1 = {
             "user_id": 123,
             "name": "John",
@@ -150,8 +158,8 @@ class AutoExcludeTestCase(TestCase):
             "timestamp": datetime.now(timezone.utc),  # Excluded
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertNotEqual(key1, key2, "Stable fields should still affect cache key")
 
@@ -161,8 +169,6 @@ class AutoExcludeTestCase(TestCase):
 
     def test_auto_exclude_nested_dicts(self):
         """Test that auto-exclude works in nested dictionaries"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "metadata": {"created": datetime.now(timezone.utc), "name": "test"}}
         dict2 = {
             "id": 1,
@@ -172,15 +178,13 @@ class AutoExcludeTestCase(TestCase):
             },
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "datetime in nested dicts should be auto-excluded")
 
     def test_auto_exclude_deeply_nested(self):
         """Test auto-exclude in deeply nested structures"""
-        kg = KeyGenerator()
-
         dict1 = {"id": 1, "level1": {"level2": {"level3": {"timestamp": datetime.now(timezone.utc), "data": "stable"}}}}
         dict2 = {
             "id": 1,
@@ -194,8 +198,8 @@ class AutoExcludeTestCase(TestCase):
             },
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "datetime in deeply nested dicts should be auto-excluded")
 
@@ -205,8 +209,6 @@ class AutoExcludeTestCase(TestCase):
 
     def test_auto_exclude_in_lists(self):
         """Test that unstable types in lists are excluded"""
-        kg = KeyGenerator()
-
         dict1 = {
             "id": 1,
             "events": [
@@ -222,8 +224,8 @@ class AutoExcludeTestCase(TestCase):
             ],
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(dict1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(dict2,), kwargs={})
 
         self.assertEqual(key1, key2, "datetime in list items should be auto-excluded")
 
@@ -233,8 +235,6 @@ class AutoExcludeTestCase(TestCase):
 
     def test_real_world_api_request(self):
         """Test real-world API request with mixed stable and unstable fields"""
-        kg = KeyGenerator()
-
         request1 = {
             "user_id": 123,
             "action": "view_profile",
@@ -250,15 +250,13 @@ class AutoExcludeTestCase(TestCase):
             "session_id": uuid.uuid4(),  # Different, but excluded
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(request1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(request2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(request1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(request2,), kwargs={})
 
         self.assertEqual(key1, key2, "Real-world request with unstable types should work")
 
     def test_real_world_database_query(self):
         """Test real-world database query filters"""
-        kg = KeyGenerator()
-
         filters1 = {
             "status": "active",
             "category": "premium",
@@ -270,7 +268,7 @@ class AutoExcludeTestCase(TestCase):
             "created_after": datetime(2025, 1, 15, tzinfo=timezone.utc),  # Different, excluded
         }
 
-        key1 = kg.generate_key(func=self._test_function, args=(filters1,), kwargs={})
-        key2 = kg.generate_key(func=self._test_function, args=(filters2,), kwargs={})
+        key1 = self.kg.generate_key(func=self._test_function, args=(filters1,), kwargs={})
+        key2 = self.kg.generate_key(func=self._test_function, args=(filters2,), kwargs={})
 
         self.assertEqual(key1, key2, "Database query filters should work with type exclusion")
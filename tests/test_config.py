@@ -230,6 +230,20 @@ class TestEasyCacheConfig(TestCase):
         with self.assertRaises(ImproperlyConfigured):
             EasyCacheConfig()
 
+    def test_invalid_key_hash_bits_validation(self):
+        """Test that KEY_HASH_BITS outside BLAKE2b's digest sizes is rejected at config load"""
+        for bits in (0, 12, 520, "64", True):
+            with self.subTest(bits=bits):
+                EasyCacheConfig._instance = None
+                with override_settings(easy_cache={"KEY_HASH_BITS": bits}):
+                    with self.assertRaisesMessage(ImproperlyConfigured, "KEY_HASH_BITS"):
+                        EasyCacheConfig()
+
+    @override_settings(easy_cache={"KEY_HASH_BITS": 128})
+    def test_valid_key_hash_bits(self):
+        """Test that a multiple of 8 within BLAKE2b's range is accepted"""
+        self.assertEqual(EasyCacheConfig().get("KEY_HASH_BITS"), 128)
+
     def test_deep_update_functionality(self):
         """Test _deep_update internal method"""
         config = EasyCacheConfig()
@@ -7,6 +7,7 @@ from django.test import TestCase, override_settings
 
 from easy_cache.decorators.base import BaseCacheDecorator
 from easy_cache.exceptions import CacheKeyValidationError
+from easy_cache.services.l1 import L1Cache
 
 
 class TestBaseCacheDecorator(TestCase):
@@ -125,6 +126,48 @@ class TestBaseCacheDecorator(TestCase):
         self.decorator.storage.set.assert_called_once()
         self.decorator.analytics.track_miss.assert_called_once()
 
+    @patch("django.utils.timezone.localtime")
+    def test_execute_with_cache_uses_l1_before_backend(self, mock_localtime):
+        """Test that a miss fills L1 and later hits are served from it without a backend lookup"""
+        mock_localtime.return_value = datetime(2025, 9, 15, 12, 0, 0)
+        self.decorator.l1 = L1Cache()
+        self.decorator.storage.get = Mock(return_value=None)
+        self.decorator.storage.set = Mock(return_value=True)
+        self.decorator.analytics.track_hit = Mock()
+        self.decorator.analytics.track_miss = Mock()
+        calls = []
+
+        def test_function():
+            calls.append(1)
+            return {"items": [1, 2]}
+
+        first = self.decorator._execute_with_cache(test_function)
+        first["items"].append(3)
+        second = self.decorator._execute_with_cache(test_function)
+
+        self.assertEqual(len(calls), 1)
+        self.decorator.storage.get.assert_called_once()
+        self.decorator.analytics.track_hit.assert_called_once()
+        # L1 hands out copies, so mutating the first result does not leak into later hits
+        self.assertEqual(second, {"items": [1, 2]})
+
+    @patch("django.utils.timezone.localtime")
+    def test_execute_with_cache_fills_l1_from_backend_hit(self, mock_localtime):
+        """Test that a backend hit is copied into L1"""
+        mock_localtime.return_value = datetime(2025, 9, 15, 12, 0, 0)
+        self.decorator.l1 = L1Cache()
+        self.decorator.storage.get = Mock(return_value="cached_result")
+        self.decorator.analytics.track_hit = Mock()
+
+        def test_function():
+            return "original_result"
+
+        self.assertEqual(self.decorator._execute_with_cache(test_function), "cached_result")
+        self.assertEqual(self.decorator._execute_with_cache(test_function), "cached_result")
+
+        self.decorator.storage.get.assert_called_once()
+        self.assertEqual(self.decorator.analytics.track_hit.call_count, 2)
+
     @patch("django.utils.timezone.localtime")
     def test_execute_with_cache_key_validation_error(self, mock_localtime):
         """Test cache execution with invalid cache key"""
@@ -141,6 +184,75 @@ class TestBaseCacheDecorator(TestCase):
         # Should fallback to original function
         self.assertEqual(result, "original_result")
 
+    def test_key_args_limits_key_to_selected_arguments(self):
+        """Test that key_args selects which arguments identify a cached call"""
+        decorator = TestableBaseCacheDecorator(key_args=lambda user_id, verbose=False: (user_id,))
+        decorator.analytics.track_miss = Mock()
+        decorator.analytics.track_hit = Mock()
+        calls = []
+
+        @decorator
+        def load_profile(user_id, verbose=False):
+            calls.append((user_id, verbose))
+            return {"user_id": user_id}
+
+        load_profile(7, verbose=False)
+        load_profile(7, verbose=True)
+        load_profile(8, verbose=False)
+
+        self.assertEqual(calls, [(7, False), (8, False)])
+        self.assertIn("key_args=[7]", decorator.analytics.track_miss.call_args_list[0].kwargs["original_params"])
+
+    def test_cache_backend_resolved_once_per_decorator(self):
+        """Test that decorated calls reuse the backend resolved at init instead of looking it up again"""
+        decorator = TestableBaseCacheDecorator()
+        decorator.analytics.track_miss = Mock()
+        decorator.analytics.track_hit = Mock()
+
+        @decorator
+        def test_function(x):
+            return x * 2
+
+        with patch.object(decorator.config, "get_cache_backend") as mock_get_backend:
+            with patch("django.core.cache.caches.__getitem__") as mock_caches_getitem:
+                self.assertEqual(test_function(21), 42)
+                self.assertEqual(test_function(21), 42)
+
+        mock_get_backend.assert_not_called()
+        mock_caches_getitem.assert_not_called()
+
+    def test_analytics_disabled_uses_noop_tracker(self):
+        """Test that ANALYTICS_ENABLED=False skips all analytics writes"""
+        from easy_cache.config import get_config
+        from easy_cache.models import CacheEntry, CacheEventHistory
+        from easy_cache.services import NoopAnalyticsTracker
+
+        config = get_config()
+        with patch.dict(config._config, {"ANALYTICS_ENABLED": False}):
+            decorator = TestableBaseCacheDecorator()
+
+        self.assertIsInstance(decorator.analytics, NoopAnalyticsTracker)
+
+        @decorator
+        def test_function(x):
+            return x * 2
+
+        self.assertEqual(test_function(4), 8)
+        self.assertEqual(test_function(4), 8)
+        self.assertFalse(CacheEntry.objects.exists())
+        self.assertFalse(CacheEventHistory.objects.exists())
+
+    def test_template_response_callback_stores_response(self):
+        """Test the post-render callback caches the response and keeps no per-instance dict"""
+        storage = Mock()
+        response = Mock()
+
+        callback = BaseCacheDecorator._cache_template_response_callback(storage, "key", 60)
+        callback(response)
+
+        storage.set.assert_called_once_with("key", response, 60)
+        self.assertFalse(hasattr(callback, "__dict__"))
+
     def test_get_expiration_date_not_implemented(self):
         """Test that _get_expiration_date raises NotImplementedError"""
         base_decorator = BaseCacheDecorator()
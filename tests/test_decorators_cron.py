@@ -40,9 +40,8 @@ class TestCronDecorator(TestCase):
 
         for expression in invalid_expressions:
             with self.assertRaises(InvalidCronExpression):
-                decorator = CronDecorator(cron_expression=expression)
-                # Force evaluation by calling _parse_cron_expression
-                decorator._parse_cron_expression(expression, datetime.now())
+                # The expression is compiled when the decorator is created
+                CronDecorator(cron_expression=expression)
 
     @override_settings(TIME_ZONE="UTC")
     def test_init_with_timezone(self):
@@ -50,21 +49,19 @@ class TestCronDecorator(TestCase):
         decorator = CronDecorator(cron_expression="*/5 * * * *", timezone_name="Europe/Berlin")
         self.assertEqual(decorator.timezone_name, "Europe/Berlin")
 
-    def test_parse_cron_expression_success(self):
-        """Test successful cron expression parsing"""
+    def test_schedule_success(self):
+        """Test building a schedule from a compiled cron expression"""
         now = datetime(2025, 9, 15, 14, 30, 0)
-        schedule = CronDecorator._parse_cron_expression("*/5 * * * *", now)
+        schedule = CronDecorator(cron_expression="*/5 * * * *")._schedule(now)
 
         # Should return a schedule object
         self.assertIsNotNone(schedule)
         self.assertTrue(hasattr(schedule, "next"))
 
-    def test_parse_cron_expression_failure(self):
-        """Test cron expression parsing failure"""
-        now = datetime(2025, 9, 15, 14, 30, 0)
-
+    def test_compile_cron_expression_failure(self):
+        """Test cron expression compilation failure"""
         with self.assertRaises(InvalidCronExpression):
-            CronDecorator._parse_cron_expression("invalid_cron", now)
+            CronDecorator._compile_cron_expression("invalid_cron")
 
     @patch("easy_cache.decorators.cron.Cron")
     def test_get_expiration_date(self, mock_cron_class):
@@ -108,6 +105,21 @@ class TestCronDecorator(TestCase):
         expected = 30 * 60  # 30 minutes in seconds
         self.assertEqual(timeout, expected)
 
+    @patch("easy_cache.decorators.cron.Cron")
+    def test_cron_expression_parsed_once(self, mock_cron_class):
+        """Test that the cron expression is parsed at init and reused for each call"""
+        mock_schedule = Mock()
+        mock_schedule.next.return_value = datetime(2025, 9, 15, 15, 0, 0)
+        mock_cron_class.return_value.schedule.return_value = mock_schedule
+
+        decorator = CronDecorator(cron_expression="0 */1 * * *")
+        now = datetime(2025, 9, 15, 14, 30, 0)
+        decorator._get_expiration_date(now)
+        decorator._calculate_timeout(now)
+
+        mock_cron_class.assert_called_once_with("0 */1 * * *")
+        self.assertEqual(mock_cron_class.return_value.schedule.call_count, 2)
+
     def test_integration_with_function_decoration(self):
         """Test that decorator works with actual function decoration"""
         call_count = 0
@@ -216,13 +228,22 @@ class TestCronDecorator(TestCase):
         self.assertEqual(timeout, 0)  # No timeout needed
 
     @patch("easy_cache.decorators.cron.Cron")
-    def test_error_handling_in_parse_cron(self, mock_cron_class):
-        """Test error handling in cron expression parsing"""
+    def test_error_handling_in_compile_cron(self, mock_cron_class):
+        """Test error handling in cron expression compilation"""
         # Mock Cron to raise an exception
         mock_cron_class.side_effect = ValueError("Invalid cron expression")
 
         with self.assertRaises(InvalidCronExpression):
-            CronDecorator._parse_cron_expression("invalid", datetime.now())
+            CronDecorator._compile_cron_expression("invalid")
+
+    @patch("easy_cache.decorators.cron.Cron")
+    def test_error_handling_in_schedule(self, mock_cron_class):
+        """Test that schedule errors surface as InvalidCronExpression"""
+        mock_cron_class.return_value.schedule.side_effect = ValueError("Invalid start date")
+        decorator = CronDecorator(cron_expression="*/5 * * * *")
+
+        with self.assertRaises(InvalidCronExpression):
+            decorator._schedule(datetime.now())
 
     def test_multiple_decorators_different_expressions(self):
         """Test multiple functions with different cron expressions"""
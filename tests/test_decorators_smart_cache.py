@@ -1,5 +1,6 @@
 """Unit tests for EasyCacheDecorator"""
 
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 
 from easy_cache.decorators.easy_cache import EasyCacheDecorator
@@ -10,9 +11,19 @@ from easy_cache.decorators.cron import CronDecorator
 class TestEasyCacheDecorator(TestCase):
     """Test cases for EasyCacheDecorator"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the default decorator once for all tests"""
+        super().setUpClass()
+        cls.decorator = EasyCacheDecorator()
+
+    def setUp(self):
+        """Reset the default cache between tests"""
+        caches["default"].clear()
+
     def test_init_default_values(self):
         """Test initialization with default values"""
-        decorator = EasyCacheDecorator()
+        decorator = self.decorator
         self.assertEqual(decorator.key_template, "{function_name}_{args_hash}")
         self.assertEqual(decorator.cache_name, "default")
         self.assertIsNotNone(decorator.cache)
@@ -30,6 +41,13 @@ class TestEasyCacheDecorator(TestCase):
         self.assertEqual(decorator.key_template, "{function_name}_{custom}")
         self.assertEqual(decorator.cache_name, "custom_cache")
 
+    def test_cache_backend_resolved_lazily(self):
+        """Test that the cache backend is only looked up on first access"""
+        decorator = EasyCacheDecorator()
+        self.assertIsNone(decorator._cache)
+        self.assertIs(decorator.cache, decorator.cache)
+        self.assertFalse(hasattr(decorator, "__dict__"))
+
     def test_time_based_classmethod_returns_time_decorator(self):
         """Test that time_based classmethod returns TimeDecorator"""
         decorator = EasyCacheDecorator.time_based(invalidate_at="14:30")
@@ -172,9 +190,7 @@ class TestEasyCacheDecorator(TestCase):
 
     def test_easy_cache_instance_cache_backend_initialization(self):
         """Test cache backend initialization in EasyCacheDecorator"""
-        from django.core.cache import caches
-
-        decorator = EasyCacheDecorator(cache_backend="default")
+        decorator = self.decorator
 
         # Should initialize cache backend
         self.assertIsNotNone(decorator.cache)
@@ -192,8 +208,6 @@ class TestEasyCacheDecorator(TestCase):
     )
     def test_easy_cache_custom_cache_backend(self):
         """Test EasyCacheDecorator with custom cache backend"""
-        from django.core.cache import caches
-
         decorator = EasyCacheDecorator(cache_backend="test_cache")
 
         self.assertEqual(decorator.cache_name, "test_cache")
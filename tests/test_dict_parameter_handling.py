@@ -1,6 +1,7 @@
 """Tests for dict and collection parameter handling in cache key generation"""
 
 import json
+from unittest.mock import patch
 from django.test import TestCase
 from easy_cache.services.key_generator import KeyGenerator
 
@@ -8,8 +9,11 @@ from easy_cache.services.key_generator import KeyGenerator
 class DictParameterHandlingTestCase(TestCase):
     """Test that dicts and collections are handled deterministically"""
 
-    def setUp(self):
-        self.kg = KeyGenerator()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # KeyGenerator keeps no per-call state, so one instance serves every test
+        cls.kg = KeyGenerator()
 
     @staticmethod
     def _test_function(data):
@@ -97,18 +101,18 @@ class DictParameterHandlingTestCase(TestCase):
         """Test that original_params contains human-readable JSON for dicts"""
         test_dict = {"name": "Alice", "age": 25, "active": True}
 
-        self.kg.generate_key(func=self._test_function, args=(test_dict,), kwargs={})
+        _, _, original_params = self.kg.build_key(func=self._test_function, args=(test_dict,), kwargs={})
 
         # original_params should contain pretty-printed JSON
-        self.assertIsNotNone(self.kg.original_params)
-        self.assertIn('"active"', self.kg.original_params)
-        self.assertIn('"age"', self.kg.original_params)
-        self.assertIn('"name"', self.kg.original_params)
+        self.assertIsNotNone(original_params)
+        self.assertIn('"active"', original_params)
+        self.assertIn('"age"', original_params)
+        self.assertIn('"name"', original_params)
 
         # Should be valid JSON
         # Note: original_params might have other formatting, so we check if it contains JSON
-        self.assertIn("{", self.kg.original_params)
-        self.assertIn("}", self.kg.original_params)
+        self.assertIn("{", original_params)
+        self.assertIn("}", original_params)
 
     def test_original_params_with_nested_structures(self):
         """Test that original_params properly handles nested structures"""
@@ -117,13 +121,13 @@ class DictParameterHandlingTestCase(TestCase):
             "settings": {"theme": "dark", "notifications": True},
         }
 
-        self.kg.generate_key(func=self._test_function, args=(nested_data,), kwargs={})
+        _, _, original_params = self.kg.build_key(func=self._test_function, args=(nested_data,), kwargs={})
 
         # Check that nested structure is preserved in original_params
-        self.assertIsNotNone(self.kg.original_params)
-        self.assertIn('"user"', self.kg.original_params)
-        self.assertIn('"settings"', self.kg.original_params)
-        self.assertIn('"admin"', self.kg.original_params)
+        self.assertIsNotNone(original_params)
+        self.assertIn('"user"', original_params)
+        self.assertIn('"settings"', original_params)
+        self.assertIn('"admin"', original_params)
 
     def test_mixed_args_with_simple_and_complex_types(self):
         """Test that mixed arguments (simple types + dicts) work correctly"""
@@ -136,6 +140,20 @@ class DictParameterHandlingTestCase(TestCase):
 
         self.assertEqual(key1, key2, "Mixed arguments should produce consistent cache keys")
 
+    def test_flat_scalar_dict_skips_exclude_filter(self):
+        """Test that dicts of plain scalars are serialized without walking the exclude-type filter"""
+        flat = {f"key_{i}": f"value_{i}" for i in range(5)}
+        flat.update({"count": 3, "ratio": 0.5, "active": True, "missing": None})
+
+        with patch.object(self.kg, "_filter_dict_for_cache", wraps=self.kg._filter_dict_for_cache) as mock_filter:
+            flat_key = self.kg.generate_key(func=self._test_function, args=(flat,), kwargs={})
+            mock_filter.assert_not_called()
+
+            self.kg.generate_key(func=self._test_function, args=({"nested": {"a": 1}},), kwargs={})
+            mock_filter.assert_called()
+
+        self.assertEqual(flat_key, self.kg.generate_key(func=self._test_function, args=(dict(flat),), kwargs={}))
+
     def test_empty_collections_produce_consistent_keys(self):
         """Test that empty collections are handled correctly"""
         empty_dict = {}
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from unittest.mock import patch
 from django.test import TestCase
 from django.contrib.auth.models import User
+from easy_cache.exceptions import UncachableArgumentError
 from easy_cache.services.key_generator import KeyGenerator
 
 
@@ -246,6 +247,16 @@ class EdgeCaseTestCase(TestCase):
             "Circular reference" in str(context.exception) or "maximum recursion" in str(context.exception).lower()
         )
 
+    def test_circular_reference_through_list_is_uncachable(self):
+        """Test that a dict reachable from itself via a list is rejected before deep recursion"""
+        circular_dict = {"a": 1}
+        circular_dict["items"] = [circular_dict]
+
+        with self.assertRaises(UncachableArgumentError) as context:
+            self.kg.generate_key(func=self._test_function, args=(circular_dict,), kwargs={})
+
+        self.assertIn("Circular reference", str(context.exception))
+
     # ==========================================
     # EDGE CASE 7: Very deep nesting
     # ==========================================
@@ -309,16 +320,16 @@ class EdgeCaseTestCase(TestCase):
         """Test that very large dicts are handled (and hashed if too long)"""
         large_dict = {f"key_{i}": f"value_{i}" for i in range(1000)}
 
-        key1 = self.kg.generate_key(func=self._test_function, args=(large_dict,), kwargs={})
+        key1, _, original_params = self.kg.build_key(func=self._test_function, args=(large_dict,), kwargs={})
         key2 = self.kg.generate_key(func=self._test_function, args=(large_dict,), kwargs={})
 
         self.assertEqual(key1, key2, "Large dicts should be handled consistently")
         # Check that it got hashed (should be relatively short)
-        self.assertIsNotNone(self.kg.original_params)
+        self.assertIsNotNone(original_params)
 
     def test_list_of_many_models(self):
         """Test list containing many Django models"""
-        users = [User.objects.create(username=f"user{i}") for i in range(50)]
+        users = User.objects.bulk_create([User(username=f"user{i}") for i in range(50)])
 
         key1 = self.kg.generate_key(func=self._test_function, args=(users,), kwargs={})
         key2 = self.kg.generate_key(func=self._test_function, args=(users,), kwargs={})
@@ -6,18 +6,12 @@ from django.test import TestCase
 from django.utils.timezone import localtime
 
 from easy_cache.decorators.easy_cache import easy_cache
-from easy_cache.models import CacheEntry, CacheEventHistory
+from easy_cache.models import CacheEntry
 
 
 class TestClassMethodIntegration(TestCase):
     """Integration tests for decorator usage in regular class methods"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        # Clear database
-        CacheEntry.objects.all().delete()
-        CacheEventHistory.objects.all().delete()
-
     def test_dataprocessor_like_class_integration(self):
         """Test decorator usage in DataProcessor-like class similar to views.py"""
 
@@ -72,13 +66,13 @@ class TestClassMethodIntegration(TestCase):
         processor = DataProcessor(user_id=1)
 
         # Test get_user_stats caching
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         stats1 = processor.get_user_stats()
-        first_call_time = time.time() - start_time
+        first_call_ns = time.perf_counter_ns() - t0
 
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         stats2 = processor.get_user_stats()
-        second_call_time = time.time() - start_time
+        second_call_ns = time.perf_counter_ns() - t0
 
         # Should return same data (cached)
         self.assertEqual(stats1, stats2)
@@ -86,7 +80,7 @@ class TestClassMethodIntegration(TestCase):
         self.assertIn("calculated_at", stats1)
 
         # Second call should be faster
-        self.assertLess(second_call_time, first_call_time)
+        self.assertLess(second_call_ns, first_call_ns)
 
         # Test get_live_metrics with parameters
         metrics1 = processor.get_live_metrics("page_views")
@@ -115,11 +109,10 @@ class TestClassMethodIntegration(TestCase):
         self.assertEqual(report3["date"], "2025-09-16")
 
         # Verify cache entries were created for different methods
-        cache_entries = CacheEntry.objects.all()
-        self.assertGreater(cache_entries.count(), 3)  # At least 3 different method calls
+        function_names = list(CacheEntry.objects.values_list("function_name", flat=True))
+        self.assertGreater(len(function_names), 3)  # At least 3 different method calls
 
         # Check that different methods have separate cache entries
-        function_names = [entry.function_name for entry in cache_entries]
         self.assertTrue(any("get_user_stats" in name for name in function_names))
         self.assertTrue(any("get_live_metrics" in name for name in function_names))
         self.assertTrue(any("generate_daily_report" in name for name in function_names))
@@ -275,10 +268,9 @@ class TestClassMethodIntegration(TestCase):
         self.assertNotEqual(base_data1, inherited_data1)
 
         # Verify separate cache entries
-        cache_entries = CacheEntry.objects.all()
-        self.assertGreater(cache_entries.count(), 2)
+        function_names = list(CacheEntry.objects.values_list("function_name", flat=True))
+        self.assertGreater(len(function_names), 2)
 
-        function_names = [entry.function_name for entry in cache_entries]
         self.assertTrue(any("get_base_data" in name for name in function_names))
         self.assertTrue(any("get_extended_data" in name for name in function_names))
 
@@ -390,22 +382,22 @@ class TestClassMethodIntegration(TestCase):
         processor = PerformanceTestProcessor()
 
         # Test cached method performance
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         cached_result1 = processor.slow_cached_method(5)  # First call (miss)
-        first_cached_time = time.time() - start_time
+        first_cached_ns = time.perf_counter_ns() - t0
 
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         cached_result2 = processor.slow_cached_method(5)  # Second call (hit)
-        second_cached_time = time.time() - start_time
+        second_cached_ns = time.perf_counter_ns() - t0
 
         # Test uncached method performance
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         uncached_result1 = processor.slow_uncached_method(5)  # Always slow
-        first_uncached_time = time.time() - start_time
+        first_uncached_ns = time.perf_counter_ns() - t0
 
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         uncached_result2 = processor.slow_uncached_method(5)  # Always slow
-        second_uncached_time = time.time() - start_time
+        second_uncached_ns = time.perf_counter_ns() - t0
 
         # Cached method should return same result
         self.assertEqual(cached_result1["work_amount"], cached_result2["work_amount"])
@@ -415,14 +407,14 @@ class TestClassMethodIntegration(TestCase):
         self.assertNotEqual(uncached_result1["timestamp"], uncached_result2["timestamp"])
 
         # Second cached call should be much faster than first
-        self.assertLess(second_cached_time, first_cached_time * 0.5)  # At least 50% faster
+        self.assertLess(second_cached_ns, first_cached_ns // 2)  # At least 50% faster
 
         # Uncached calls should take similar time
-        self.assertAlmostEqual(first_uncached_time, second_uncached_time, delta=0.01)
+        self.assertAlmostEqual(first_uncached_ns, second_uncached_ns, delta=10_000_000)
 
         # Second cached call should be faster than uncached calls
-        self.assertLess(second_cached_time, first_uncached_time * 0.5)
-        self.assertLess(second_cached_time, second_uncached_time * 0.5)
+        self.assertLess(second_cached_ns, first_uncached_ns // 2)
+        self.assertLess(second_cached_ns, second_uncached_ns // 2)
 
     def test_class_methods_with_different_invalidation_strategies(self):
         """Test class with multiple methods using different invalidation strategies"""
@@ -493,11 +485,10 @@ class TestClassMethodIntegration(TestCase):
         self.assertEqual(summary1["processor_id"], 42)
 
         # Verify cache entries for different strategies
-        cache_entries = CacheEntry.objects.all()
-        self.assertGreater(cache_entries.count(), 3)  # At least 4 different cached calls
+        function_names = list(CacheEntry.objects.values_list("function_name", flat=True))
+        self.assertGreater(len(function_names), 3)  # At least 4 different cached calls
 
         # Check that all methods are represented
-        function_names = [entry.function_name for entry in cache_entries]
         self.assertTrue(any("get_morning_report" in name for name in function_names))
         self.assertTrue(any("get_quarterly_stats" in name for name in function_names))
         self.assertTrue(any("get_daily_summary" in name for name in function_names))
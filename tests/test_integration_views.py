@@ -9,7 +9,7 @@ from django.views.generic import ListView
 from django.utils.timezone import localtime
 
 from easy_cache.decorators.easy_cache import easy_cache
-from easy_cache.models import CacheEntry, CacheEventHistory
+from easy_cache.models import CacheEntry
 
 
 class TestFunctionBasedViewsIntegration(TestCase):
@@ -18,9 +18,6 @@ class TestFunctionBasedViewsIntegration(TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.factory = RequestFactory()
-        # Clear database
-        CacheEntry.objects.all().delete()
-        CacheEventHistory.objects.all().delete()
 
     def get_json_data(self, response):
         """Helper method to extract JSON data from JsonResponse"""
@@ -48,9 +45,9 @@ class TestFunctionBasedViewsIntegration(TestCase):
         request = self.factory.get("/test/")
 
         # First call - should be cache miss
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         response1 = test_time_view(request)
-        first_call_time = time.time() - start_time
+        first_call_ns = time.perf_counter_ns() - t0
 
         self.assertIsInstance(response1, JsonResponse)
         self.assertEqual(response1.status_code, 200)
@@ -61,9 +58,9 @@ class TestFunctionBasedViewsIntegration(TestCase):
         self.assertEqual(response1_data["test"], "time_based_function_view")
 
         # Second call - should be cache hit (faster)
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         response2 = test_time_view(request)
-        second_call_time = time.time() - start_time
+        second_call_ns = time.perf_counter_ns() - t0
 
         self.assertIsInstance(response2, JsonResponse)
         self.assertEqual(response2.status_code, 200)
@@ -73,7 +70,7 @@ class TestFunctionBasedViewsIntegration(TestCase):
         self.assertEqual(response1_data, response2_data)
 
         # Second call should be significantly faster
-        self.assertLess(second_call_time, first_call_time)
+        self.assertLess(second_call_ns, first_call_ns)
 
         # Verify cache entry was created
         cache_entries = CacheEntry.objects.all()
@@ -240,11 +237,10 @@ class TestFunctionBasedViewsIntegration(TestCase):
         self.assertEqual(midnight_data["reset"], "midnight")
 
         # Should have separate cache entries
-        cache_entries = CacheEntry.objects.all()
-        self.assertEqual(cache_entries.count(), 3)
+        function_names = list(CacheEntry.objects.values_list("function_name", flat=True))
+        self.assertEqual(len(function_names), 3)
 
         # Check function names are different
-        function_names = [entry.function_name for entry in cache_entries]
         self.assertIn("daily_report_view", str(function_names))
         self.assertIn("hourly_stats_view", str(function_names))
         self.assertIn("midnight_view", str(function_names))
@@ -299,9 +295,6 @@ class TestClassBasedViewsIntegration(TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.factory = RequestFactory()
-        # Clear database
-        CacheEntry.objects.all().delete()
-        CacheEventHistory.objects.all().delete()
 
     def get_json_data(self, response):
         """Helper method to extract JSON data from JsonResponse"""
@@ -427,8 +420,6 @@ class TestViewIntegrationEdgeCases(TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.factory = RequestFactory()
-        CacheEntry.objects.all().delete()
-        CacheEventHistory.objects.all().delete()
 
     def get_json_data(self, response):
         """Helper method to extract JSON data from JsonResponse"""
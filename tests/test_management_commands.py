@@ -1,10 +1,12 @@
 """Unit tests for management commands"""
 
 import io
+import json
+from argparse import _SubParsersAction
 from unittest.mock import Mock, patch
 from datetime import timedelta
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.utils.timezone import localtime
@@ -13,155 +15,165 @@ from easy_cache.models import CacheEntry, CacheEventHistory
 from easy_cache.management.commands.easy_cache import Command
 
 
-class TestEasyCacheCommand(TestCase):
-    """Test cases for easy_cache management command"""
+# Resolved once so the tests skip call_command's per-call command lookup and instantiation
+_COMMAND = Command()
 
-    def setUp(self):
-        """Set up test fixtures"""
-        # Clear database
-        CacheEntry.objects.all().delete()
-        CacheEventHistory.objects.all().delete()
 
-        # Create test data
-        self.create_test_data()
+@override_settings(DEBUG=False, LOGGING_CONFIG=None)
+class TestEasyCacheCommand(TestCase):
+    """Test cases for easy_cache management command"""
 
-    def create_test_data(self):
-        """Create test cache entries and events"""
-        now = localtime()
+    @classmethod
+    def setUpTestData(cls):
+        """Create test cache entries and events once for the class"""
+        # Snapshot shared by the fixtures and the expiry assertions; entry2 expires an hour before it
+        cls.now = now = localtime()
 
         # Create cache entries
-        self.entry1 = CacheEntry.objects.create(
-            cache_key="test_key_1",
-            function_name="test.function1",
-            cache_backend="default",
-            timeout=3600,
-            hit_count=10,
-            miss_count=2,
-            access_count=12,
-            expires_at=now + timedelta(hours=1),
-        )
-
-        self.entry2 = CacheEntry.objects.create(
-            cache_key="test_key_2",
-            function_name="test.function2",
-            cache_backend="redis",
-            timeout=7200,
-            hit_count=5,
-            miss_count=5,
-            access_count=10,
-            expires_at=now - timedelta(hours=1),  # Expired
+        cls.entry1, cls.entry2 = CacheEntry.objects.bulk_create(
+            [
+                CacheEntry(
+                    cache_key="test_key_1",
+                    cache_key_hash=CacheEntry.hash_cache_key("test_key_1"),
+                    function_name="test.function1",
+                    cache_backend="default",
+                    timeout=3600,
+                    hit_count=10,
+                    miss_count=2,
+                    access_count=12,
+                    expires_at=now + timedelta(hours=1),
+                ),
+                CacheEntry(
+                    cache_key="test_key_2",
+                    cache_key_hash=CacheEntry.hash_cache_key("test_key_2"),
+                    function_name="test.function2",
+                    cache_backend="redis",
+                    timeout=7200,
+                    hit_count=5,
+                    miss_count=5,
+                    access_count=10,
+                    expires_at=now - timedelta(hours=1),  # Expired
+                ),
+            ]
         )
 
         # Create event history
-        self.event1 = CacheEventHistory.objects.create(
-            event_name="cache_hit",
-            event_type=CacheEventHistory.EventType.HIT,
-            function_name="test.function1",
-            cache_key="test_key_1",
-            duration_ms=10,
+        cls.event1, cls.event2 = CacheEventHistory.objects.bulk_create(
+            [
+                CacheEventHistory(
+                    event_name="cache_hit",
+                    event_type=CacheEventHistory.EventType.HIT,
+                    function_name="test.function1",
+                    cache_key="test_key_1",
+                    duration_ms=10,
+                ),
+                CacheEventHistory(
+                    event_name="cache_miss",
+                    event_type=CacheEventHistory.EventType.MISS,
+                    function_name="test.function2",
+                    cache_key="test_key_2",
+                    duration_ms=150,
+                ),
+            ]
         )
 
-        self.event2 = CacheEventHistory.objects.create(
-            event_name="cache_miss",
-            event_type=CacheEventHistory.EventType.MISS,
-            function_name="test.function2",
-            cache_key="test_key_2",
-            duration_ms=150,
-        )
+    def setUp(self):
+        """Set up the output buffer reused by every command run in a test"""
+        self.out = io.StringIO()
+
+    def run_easy_cache(self, *args, **options) -> str:
+        """Run the easy_cache command with the given arguments and return its stdout"""
+        self.out.seek(0)
+        self.out.truncate()
+        call_command(_COMMAND, *args, stdout=self.out, **options)
+        return self.out.getvalue()
+
+    def assertOutputContains(self, output: str, *needles: str) -> None:
+        """Assert that every needle occurs in the command output, reporting all missing ones at once"""
+        self.assertEqual([needle for needle in needles if needle not in output], [])
 
     def test_analytics_subcommand_basic(self):
         """Test analytics subcommand basic functionality"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics")
 
-        self.assertIn("Cache Analytics", output)
-        self.assertIn("Total Entries:", output)
+        self.assertOutputContains(output, "Cache Analytics", "Total Entries:")
 
     def test_analytics_subcommand_detailed_output(self):
         """Test analytics subcommand with detailed output"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics")
 
         # Check for specific statistics
         self.assertIn("Total Entries:", output)
 
     def test_analytics_with_days_filter(self):
         """Test analytics command with days filter"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", "--days", "1", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics", "--days", "1")
 
         self.assertIn("Cache Analytics", output)
 
     def test_analytics_with_json_format(self):
         """Test analytics command with JSON format"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", "--format", "json", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics", "--format", "json")
 
         # Should be valid JSON
-        import json
-
         try:
             data = json.loads(output)
-            self.assertIn("total_entries", data)
+            self.assertEqual(data["total_entries"], 2)
         except json.JSONDecodeError:
             self.fail("Output is not valid JSON")
 
     def test_clear_cache_entries_subcommand(self):
         """Test clear --cache-entries subcommand"""
-        original_entries = CacheEntry.objects.count()
-        self.assertGreater(original_entries, 0)
+        self.assertTrue(CacheEntry.objects.exists())
 
-        out = io.StringIO()
-        call_command("easy_cache", "clear", "--cache-entries", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("clear", "--cache-entries")
 
         self.assertIn("cache entries successfully deleted", output)
 
         # Verify cache entries were cleared
-        self.assertEqual(CacheEntry.objects.count(), 0)
+        self.assertFalse(CacheEntry.objects.exists())
 
     def test_clear_event_history_subcommand(self):
         """Test clear --event-history subcommand"""
-        original_events = CacheEventHistory.objects.count()
-        self.assertGreater(original_events, 0)
+        self.assertTrue(CacheEventHistory.objects.exists())
 
-        out = io.StringIO()
-        call_command("easy_cache", "clear", "--event-history", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("clear", "--event-history")
 
         self.assertIn("event history entries successfully deleted", output)
 
         # Verify event history was cleared
-        self.assertEqual(CacheEventHistory.objects.count(), 0)
+        self.assertFalse(CacheEventHistory.objects.exists())
+
+    def test_clear_expired_subcommand(self):
+        """Test clear --expired subcommand"""
+        self.assertTrue(CacheEntry.objects.filter(expires_at__lt=self.now).exists())
+
+        output = self.run_easy_cache("clear", "--expired")
+
+        self.assertIn("1 expired cache entries successfully deleted", output)
+
+        # Only the non-expired entry remains
+        self.assertFalse(CacheEntry.objects.filter(expires_at__lt=self.now).exists())
+        self.assertEqual(list(CacheEntry.objects.values_list("cache_key", flat=True)), ["test_key_1"])
 
     def test_clear_without_options(self):
         """Test clear command without specific options shows help"""
-        out = io.StringIO()
-        call_command("easy_cache", "clear", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("clear")
 
         self.assertIn("Please select an option", output)
 
     def test_invalid_subcommand(self):
         """Test handling of invalid subcommand"""
         with self.assertRaises(CommandError):
-            call_command("easy_cache", "invalid_command")
+            self.run_easy_cache("invalid_command")
 
     def test_command_with_verbosity_levels(self):
         """Test command with different verbosity levels"""
         # Test verbosity 0 (quiet)
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", verbosity=0, stdout=out)
-        quiet_output = out.getvalue()
+        quiet_output = self.run_easy_cache("analytics", verbosity=0)
 
         # Test verbosity 2 (verbose)
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", verbosity=2, stdout=out)
-        verbose_output = out.getvalue()
+        verbose_output = self.run_easy_cache("analytics", verbosity=2)
 
         # Both should produce output, but we can't easily test length differences
         self.assertIn("Cache Analytics", quiet_output)
@@ -169,9 +181,7 @@ class TestEasyCacheCommand(TestCase):
 
     def test_analytics_with_days_range(self):
         """Test analytics command with days range"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", "--days", "1", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics", "--days", "1")
 
         self.assertIn("Cache Analytics", output)
 
@@ -181,26 +191,19 @@ class TestEasyCacheCommand(TestCase):
         CacheEntry.objects.all().delete()
         CacheEventHistory.objects.all().delete()
 
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics")
 
         self.assertIn("No cache entries found", output)
 
     def test_status_subcommand(self):
         """Test status subcommand"""
-        out = io.StringIO()
-        call_command("easy_cache", "status", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("status")
 
-        self.assertIn("Easy Cache Status", output)
-        self.assertIn("Backend:", output)
+        self.assertOutputContains(output, "Easy Cache Status", "Backend:")
 
     def test_status_with_backend_filter(self):
         """Test status command with backend filter"""
-        out = io.StringIO()
-        call_command("easy_cache", "status", "--backend", "default", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("status", "--backend", "default")
 
         self.assertIn("Backend: default", output)
 
@@ -216,6 +219,16 @@ class TestEasyCacheCommand(TestCase):
         self.assertIsNotNone(command.help)
         self.assertIn("Easy Cache", command.help)
 
+    def test_command_help(self):
+        """Test that the parser exposes the subcommands and their options"""
+        parser = Command().create_parser("manage.py", "easy_cache")
+        subcommands = next(action.choices for action in parser._actions if isinstance(action, _SubParsersAction))
+
+        self.assertLessEqual({"status", "clear", "analytics"}, subcommands.keys())
+
+        clear_options = {option for action in subcommands["clear"]._actions for option in action.option_strings}
+        self.assertLessEqual({"--cache-entries", "--event-history", "--expired"}, clear_options)
+
     def test_command_argument_parsing(self):
         """Test command argument parsing"""
         command = Command()
@@ -234,14 +247,12 @@ class TestEasyCacheCommand(TestCase):
     @patch("easy_cache.management.commands.easy_cache.Command.handle_analytics")
     def test_subcommand_routing(self, mock_handle_analytics):
         """Test that subcommands are routed correctly"""
-        call_command("easy_cache", "analytics")
+        self.run_easy_cache("analytics")
         mock_handle_analytics.assert_called_once()
 
     def test_output_formatting(self):
         """Test output formatting consistency"""
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", stdout=out)
-        output = out.getvalue()
+        output = self.run_easy_cache("analytics")
 
         # Check for consistent formatting
         lines = output.split("\n")
@@ -252,20 +263,14 @@ class TestEasyCacheCommand(TestCase):
     def test_command_with_different_formats(self):
         """Test command with different output formats"""
         # Test table format (default)
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", stdout=out)
-        table_output = out.getvalue()
+        table_output = self.run_easy_cache("analytics")
         self.assertIn("Cache Analytics", table_output)
 
         # Test JSON format
-        out = io.StringIO()
-        call_command("easy_cache", "analytics", "--format", "json", stdout=out)
-        json_output = out.getvalue()
-
-        import json
+        json_output = self.run_easy_cache("analytics", "--format", "json")
 
         try:
             data = json.loads(json_output)
-            self.assertIn("total_entries", data)
+            self.assertEqual(data["total_entries"], 2)
         except json.JSONDecodeError:
             self.fail("JSON output is not valid")
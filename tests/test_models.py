@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 
+from django.db.models import Count
 from django.test import TestCase
 from django.utils.timezone import localtime
 
@@ -11,10 +12,6 @@ from easy_cache.models import CacheEntry, CacheEventHistory
 class TestCacheEntry(TestCase):
     """Test cases for CacheEntry model"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        CacheEntry.objects.all().delete()
-
     def test_create_cache_entry(self):
         """Test creating a basic CacheEntry"""
         entry = CacheEntry.objects.create(
@@ -135,6 +132,18 @@ class TestCacheEntry(TestCase):
         self.assertGreater(time_left.total_seconds(), 3500)  # Close to 1 hour
         self.assertLess(time_left.total_seconds(), 3700)  # But not exactly due to execution time
 
+    def test_expiry_helpers_use_given_now(self):
+        """Test that is_expired_at/time_left_at evaluate against the passed timestamp"""
+        now = localtime()
+        entry = CacheEntry(
+            cache_key="test_key", function_name="test_function", timeout=3600, expires_at=now + timedelta(minutes=5)
+        )
+
+        self.assertFalse(entry.is_expired_at(now))
+        self.assertEqual(entry.time_left_at(now), timedelta(minutes=5))
+        self.assertTrue(entry.is_expired_at(now + timedelta(minutes=6)))
+        self.assertEqual(entry.time_left_at(now + timedelta(minutes=6)), timedelta(0))
+
     def test_cache_entry_indexes(self):
         """Test that database indexes are properly defined"""
         # This test ensures indexes are defined in meta
@@ -147,7 +156,7 @@ class TestCacheEntry(TestCase):
         # Verify some key indexes exist
         self.assertIn(["function_name", "created_at"], index_fields)
         self.assertIn(["cache_key", "last_accessed"], index_fields)
-        self.assertIn(["expires_at"], index_fields)
+        self.assertIn(["cache_backend", "expires_at"], index_fields)
 
     def test_cache_entry_unique_together_behavior(self):
         """Test behavior with multiple entries for same cache key"""
@@ -160,14 +169,57 @@ class TestCacheEntry(TestCase):
         self.assertEqual(CacheEntry.objects.filter(cache_key="same_key").count(), 2)
         self.assertNotEqual(entry1.pk, entry2.pk)
 
+    def test_cache_key_hash_populated_on_save(self):
+        """Test that the binary cache key digest is kept in sync with cache_key"""
+        entry = CacheEntry.objects.create(cache_key="test_key", function_name="f", timeout=60)
+        self.assertEqual(bytes(entry.cache_key_hash), CacheEntry.hash_cache_key("test_key"))
+        self.assertEqual(len(entry.cache_key_hash), 16)
+
+        entry.cache_key = "other_key"
+        entry.save(update_fields=["cache_key"])
+
+        self.assertTrue(CacheEntry.objects.filter(cache_key_hash=CacheEntry.hash_cache_key("other_key")).exists())
+
+    def test_with_stats_annotations_match_properties(self):
+        """Test that with_stats() computes hit rate and expiry in the database"""
+        now = localtime()
+        CacheEntry.objects.create(
+            cache_key="a", function_name="f", timeout=60, hit_count=8, miss_count=2, expires_at=now - timedelta(hours=1)
+        )
+        CacheEntry.objects.create(cache_key="b", function_name="f", timeout=60, expires_at=now + timedelta(hours=1))
+
+        entries = {entry.cache_key: entry for entry in CacheEntry.objects.with_stats()}
+
+        self.assertEqual(entries["a"].total_requests, 10)
+        self.assertAlmostEqual(entries["a"].hit_percentage, entries["a"].hit_rate)
+        self.assertTrue(entries["a"].expired)
+        self.assertEqual(entries["b"].hit_percentage, 0.0)
+        self.assertFalse(entries["b"].expired)
+
+    def test_delete_expired_removes_only_expired_entries(self):
+        """Test batched deletion of expired entries"""
+        now = localtime()
+        for i in range(5):
+            CacheEntry.objects.create(
+                cache_key=f"expired_{i}", function_name="f", timeout=60, expires_at=now - timedelta(minutes=1)
+            )
+        CacheEntry.objects.create(cache_key="valid", function_name="f", timeout=60, expires_at=now + timedelta(hours=1))
+        CacheEntry.objects.create(cache_key="no_expiry", function_name="f", timeout=0)
+
+        self.assertEqual(len(CacheEntry.objects.expired_batch(n=3)), 3)
+
+        deleted = CacheEntry.objects.delete_expired(batch_size=2)
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(
+            sorted(CacheEntry.objects.values_list("cache_key", flat=True)),
+            ["no_expiry", "valid"],
+        )
+
 
 class TestCacheEventHistory(TestCase):
     """Test cases for CacheEventHistory model"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        CacheEventHistory.objects.all().delete()
-
     def test_create_cache_event(self):
         """Test creating a basic CacheEventHistory"""
         event = CacheEventHistory.objects.create(
@@ -297,9 +349,15 @@ class TestCacheEventHistory(TestCase):
         misses = CacheEventHistory.objects.filter(event_type=CacheEventHistory.EventType.MISS)
         errors = CacheEventHistory.objects.filter(event_type=CacheEventHistory.EventType.ERROR)
 
-        self.assertEqual(hits.count(), 1)
-        self.assertEqual(misses.count(), 1)
-        self.assertEqual(errors.count(), 1)
+        counts = dict(CacheEventHistory.objects.values_list("event_type").annotate(Count("id")))
+        self.assertEqual(
+            counts,
+            {
+                CacheEventHistory.EventType.HIT: 1,
+                CacheEventHistory.EventType.MISS: 1,
+                CacheEventHistory.EventType.ERROR: 1,
+            },
+        )
 
         self.assertEqual(hits.first().event_name, "hit1")
         self.assertEqual(misses.first().event_name, "miss1")
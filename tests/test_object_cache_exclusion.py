@@ -204,11 +204,11 @@ class ObjectSerializationTestCase(TestCase):
         """Test that generated cache keys don't contain memory addresses (0x...)"""
         obj = SimpleObject("test", 42, datetime.now(timezone.utc))
 
-        self.kg.generate_key(func=self._test_function, args=(obj,), kwargs={})
+        _, _, original_params = self.kg.build_key(func=self._test_function, args=(obj,), kwargs={})
 
         # Check that original_params doesn't contain hex memory addresses
-        self.assertIsNotNone(self.kg.original_params)
-        self.assertNotIn("0x", self.kg.original_params.lower(), "Cache key should not contain memory addresses")
+        self.assertIsNotNone(original_params)
+        self.assertNotIn("0x", original_params.lower(), "Cache key should not contain memory addresses")
 
     def test_multiple_objects_same_function_different_keys(self):
         """Test that different objects produce different cache keys"""
@@ -2,18 +2,30 @@
 
 import uuid
 import decimal
+import ipaddress
 import pathlib
+import random
+from collections import Counter
+from enum import Enum
 from datetime import datetime, date, time, timedelta, timezone
 from django.test import TestCase
 from django.contrib.auth.models import User
 from easy_cache.services.key_generator import KeyGenerator
 
 
+class Status(Enum):
+    PENDING = 1
+    ACTIVE = 2
+    INACTIVE = 3
+
+
 class ProblematicTypesTestCase(TestCase):
     """Test types that could cause cache key instability"""
 
-    def setUp(self):
-        self.kg = KeyGenerator()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.kg = KeyGenerator()
 
     @staticmethod
     def _test_function(data):
@@ -141,8 +153,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_random_values(self):
         """Test random number generation"""
-        import random
-
         dict1 = {"id": 1, "nonce": random.random()}
         dict2 = {"id": 1, "nonce": random.random()}
 
@@ -230,8 +240,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_ip_address(self):
         """Test IP address fields (Django has IPAddressField)"""
-        import ipaddress
-
         dict1 = {"user_id": 1, "ip": ipaddress.IPv4Address("192.168.1.1")}
         dict2 = {"user_id": 1, "ip": ipaddress.IPv4Address("192.168.1.1")}
 
@@ -242,8 +250,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_ip_address_different(self):
         """Test different IP addresses"""
-        import ipaddress
-
         dict1 = {"user_id": 1, "client_ip": ipaddress.IPv4Address("192.168.1.1")}
         dict2 = {"user_id": 1, "client_ip": ipaddress.IPv4Address("192.168.1.2")}
 
@@ -260,8 +266,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_counter(self):
         """Test collections.Counter"""
-        from collections import Counter
-
         dict1 = {"id": 1, "counts": Counter(["a", "b", "a"])}
         dict2 = {"id": 1, "counts": Counter(["b", "a", "a"])}
 
@@ -301,13 +305,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_enum_field(self):
         """Test Enum fields"""
-        from enum import Enum
-
-        class Status(Enum):
-            PENDING = 1
-            ACTIVE = 2
-            INACTIVE = 3
-
         dict1 = {"user_id": 1, "status": Status.ACTIVE}
         dict2 = {"user_id": 1, "status": Status.ACTIVE}
 
@@ -318,12 +315,6 @@ class ProblematicTypesTestCase(TestCase):
 
     def test_enum_different_values(self):
         """Test different Enum values"""
-        from enum import Enum
-
-        class Status(Enum):
-            PENDING = 1
-            ACTIVE = 2
-
         dict1 = {"user_id": 1, "status": Status.PENDING}
         dict2 = {"user_id": 1, "status": Status.ACTIVE}
 
@@ -1,7 +1,16 @@
 """Unit tests for KeyGenerator service"""
 
-from datetime import datetime
+import hashlib
+import inspect
+import ipaddress
+import json
+import pathlib
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
 from unittest.mock import Mock, patch, call
+from zoneinfo import ZoneInfo
 
 from django.test import TestCase
 from django.http import HttpRequest
@@ -39,9 +48,20 @@ class TestKeyGenerator(TestCase):
         self.assertIn("test_function", key)
         self.assertTrue(key.startswith("easy_cache:"))
 
-        # Verify function name and params are stored
-        self.assertIn("test_function", self.generator.function_name)
-        self.assertIsNotNone(self.generator.original_params)
+    def test_build_key_returns_parts(self):
+        """Test build_key returns the key with its function name and params, without storing them"""
+
+        def test_function(x, y):
+            return x + y
+
+        key, function_name, original_params = self.generator.build_key(
+            func=test_function, args=(1, 2), kwargs={}, expiration_date=None
+        )
+
+        self.assertEqual(key, self.generator.generate_key(func=test_function, args=(1, 2), kwargs={}))
+        self.assertIn("test_function", function_name)
+        self.assertEqual(original_params, "1&2")
+        self.assertFalse(hasattr(self.generator, "original_params"))
 
     def test_generate_key_with_expiration_date(self):
         """Test cache key generation with expiration date"""
@@ -56,6 +76,204 @@ class TestKeyGenerator(TestCase):
         # Should contain expiration date in formatted form
         self.assertIn("20250915_143000", key)
 
+    def test_expiration_format_distinguishes_timezones(self):
+        """Test that equal instants in different timezones keep their own wall-clock suffix"""
+
+        def test_function():
+            return "test"
+
+        utc_date = datetime(2025, 9, 15, 12, 30, 0, tzinfo=ZoneInfo("UTC"))
+        berlin_date = utc_date.astimezone(ZoneInfo("Europe/Berlin"))
+
+        utc_key = self.generator.generate_key(func=test_function, args=(), kwargs={}, expiration_date=utc_date)
+        berlin_key = self.generator.generate_key(func=test_function, args=(), kwargs={}, expiration_date=berlin_date)
+
+        self.assertTrue(utc_key.endswith("_20250915_123000"))
+        self.assertTrue(berlin_key.endswith("_20250915_143000"))
+
+    def test_datetime_params_keep_their_timezone_offset(self):
+        """Test that memoized datetime serialization does not mix up equal instants in different timezones"""
+        utc_value = datetime(2025, 9, 15, 12, 30, 0, tzinfo=ZoneInfo("UTC"))
+        berlin_value = utc_value.astimezone(ZoneInfo("Europe/Berlin"))
+
+        self.assertEqual(self.generator._json_default(utc_value), "2025-09-15T12:30:00.000000+00:00")
+        self.assertEqual(self.generator._json_default(berlin_value), "2025-09-15T14:30:00.000000+02:00")
+
+    def test_datetime_params_keep_dst_fold_apart(self):
+        """Test that the repeated wall-clock hour at a DST change serializes with each instant's own offset"""
+        first = datetime(2025, 10, 26, 2, 30, tzinfo=ZoneInfo("Europe/Berlin"))
+        second = first.replace(fold=1)
+
+        self.assertEqual(self.generator._json_default(first), "2025-10-26T02:30:00.000000+02:00")
+        self.assertEqual(self.generator._json_default(second), "2025-10-26T02:30:00.000000+01:00")
+
+        def test_function(when):
+            return when
+
+        self.assertNotEqual(
+            self.generator.generate_key(func=test_function, args=(first,), kwargs={}),
+            self.generator.generate_key(func=test_function, args=(second,), kwargs={}),
+        )
+
+    def test_json_default_stdlib_leaves_use_string_form(self):
+        """Test that slotted stdlib values resolved by exact type keep their str() representation"""
+        values = [
+            timedelta(days=1, seconds=3),
+            pathlib.PurePosixPath("/srv/data"),
+            ipaddress.ip_address("10.0.0.1"),
+            ipaddress.ip_address("::1"),
+            3 + 4j,
+            b"raw",
+        ]
+
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(self.generator._json_default(value), str(value))
+
+    def test_generate_key_uses_blake2b_params_hash(self):
+        """Test that the params hash is a BLAKE2b digest sized by KEY_HASH_BITS"""
+
+        def test_function(x, y):
+            return x + y
+
+        key, _, original_params = self.generator.build_key(func=test_function, args=(1, 2), kwargs={})
+
+        expected = hashlib.blake2b(original_params.encode(), digest_size=8).hexdigest()
+        self.assertTrue(key.endswith(f"_{expected}"))
+
+    def test_dumps_matches_stdlib_json(self):
+        """Test that parameter serialization is compact, key-sorted JSON with a stdlib fallback"""
+        value = {"b": [1, 2.5, None], "a": {"y": True, "x": "text"}}
+        self.assertEqual(
+            self.generator._dumps(value),
+            json.dumps(value, sort_keys=True, separators=(",", ":")),
+        )
+        # Integers beyond 64 bits are rejected by orjson and handled by the stdlib encoder
+        self.assertEqual(self.generator._dumps(2**70), str(2**70))
+
+    def test_dumps_keeps_enums_and_non_finite_floats_distinct(self):
+        """Test that values orjson would collapse (Enums, NaN, infinities) keep their stdlib form"""
+
+        class Color(Enum):
+            RED = 1
+
+        @dataclass
+        class Point:
+            color: Color
+
+        self.assertEqual(self.generator._dumps({"c": Color.RED}), '{"c":"Color.RED"}')
+        self.assertEqual(self.generator._dumps(Point(Color.RED)), '{"color":"Color.RED"}')
+        self.assertEqual(
+            [self.generator._dumps(value) for value in (float("nan"), float("inf"), float("-inf"))],
+            ["NaN", "Infinity", "-Infinity"],
+        )
+        self.assertEqual(self.generator._dumps({"x": float("nan")}), '{"x":NaN}')
+
+    def test_enum_and_non_finite_params_get_distinct_keys(self):
+        """Test that Enum members, their raw values, NaN, infinity and None never share a cache key"""
+
+        class Color(Enum):
+            RED = 1
+
+        class Size(Enum):
+            SMALL = 1
+
+        def test_function(x):
+            return x
+
+        def key_for(value):
+            return self.generator.generate_key(func=test_function, args=(), kwargs={"x": value})
+
+        dict_keys = {key_for({"c": value}) for value in (Color.RED, Size.SMALL, 1)}
+        self.assertEqual(len(dict_keys), 3)
+        scalar_keys = {key_for(value) for value in (float("nan"), float("inf"), None)}
+        self.assertEqual(len(scalar_keys), 3)
+
+    def test_float_subclass_params_get_distinct_keys(self):
+        """Test that float subclasses are encoded by value instead of collapsing to the same key"""
+
+        class Price(float):
+            pass
+
+        def test_function(x):
+            return x
+
+        key1 = self.generator.generate_key(func=test_function, args=(Price(1.5),), kwargs={})
+        key2 = self.generator.generate_key(func=test_function, args=(Price(2.5),), kwargs={})
+
+        self.assertNotEqual(key1, key2)
+        self.assertEqual(self.generator._dumps(Price(1.5)), "1.5")
+
+    def test_collection_params_with_enums_and_non_finite_floats_get_distinct_keys(self):
+        """Test that list and dict arguments holding Enums, NaN or infinity keep their own keys"""
+
+        class Color(Enum):
+            RED = 1
+
+        class Size(Enum):
+            SMALL = 1
+
+        def test_function(x):
+            return x
+
+        def key_for(value):
+            return self.generator.generate_key(func=test_function, args=(value,), kwargs={})
+
+        self.assertEqual(len({key_for([value]) for value in (Color.RED, Size.SMALL, 1)}), 3)
+        self.assertEqual(len({key_for([value]) for value in (float("inf"), float("nan"), None)}), 3)
+        self.assertEqual(len({key_for({"c": value}) for value in (Color.RED, Size.SMALL, 1)}), 3)
+        self.assertEqual(len({key_for({"v": value}) for value in (float("-inf"), None)}), 2)
+        self.assertEqual(self.generator._serialize_collection([Color.RED, float("inf")]), '["Color.RED",Infinity]')
+
+    def test_collection_params_with_nested_namedtuples_and_float_subclasses(self):
+        """Test that subclasses nested in lists and dicts keep their stdlib form"""
+
+        class Obj:
+            def __init__(self, v):
+                self.v = v
+
+        P = namedtuple("P", ["a", "b"])
+
+        class Price(float):
+            pass
+
+        self.assertEqual(self.generator._serialize_collection({"p": P(1, Obj(3))}), '{"p":[1,{"v":3}]}')
+        self.assertEqual(self.generator._serialize_collection([Price(1.5)]), "[1.5]")
+        self.assertEqual(self.generator._serialize_collection({"x": Price(1.5)}), '{"x":1.5}')
+
+        def test_function(x):
+            return x
+
+        def key_for(value):
+            return self.generator.generate_key(func=test_function, args=(value,), kwargs={})
+
+        self.assertEqual(key_for({"p": P(1, Obj(3))}), key_for({"p": P(1, Obj(3))}))
+        self.assertNotEqual(key_for([Price(1.5)]), key_for([Price(2.5)]))
+        self.assertNotEqual(key_for({"x": Price(1.5)}), key_for({"x": Price(2.5)}))
+
+    def test_dumps_primitive_fast_path_matches_json(self):
+        """Test that primitives skipping the encoder serialize exactly like JSON"""
+        values = [0, -42, True, False, None, "plain", "with space", "", 'quo"te', "back\\slash", "tab\tchar", "café"]
+
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(json.loads(self.generator._dumps(value)), value)
+        self.assertEqual(self.generator._dumps("plain"), '"plain"')
+        self.assertEqual(self.generator._dumps(True), "true")
+        # Equal values of different types must not share a memo entry
+        self.assertEqual([self.generator._dumps(1), self.generator._dumps(True)], ["1", "true"])
+        self.assertEqual([self.generator._dumps(0.0), self.generator._dumps(-0.0)], ["0.0", "-0.0"])
+
+    def test_dumps_lone_surrogate_falls_back_to_stdlib(self):
+        """Test that strings orjson rejects, like a lone surrogate, are still serialized"""
+        self.assertEqual(self.generator._dumps("\ud800"), json.dumps("\ud800"))
+
+        def test_function(x):
+            return x
+
+        key = self.generator.generate_key(func=test_function, args=("\ud800",), kwargs={})
+        self.assertTrue(key.startswith("easy_cache:"))
+
     def test_generate_key_with_kwargs(self):
         """Test cache key generation with keyword arguments"""
 
@@ -123,6 +341,23 @@ class TestKeyGenerator(TestCase):
         self.assertIn("1", params)
         self.assertIn("2", params)
 
+    def test_self_detection_is_cached_per_function(self):
+        """Test the signature of a decorated function is only inspected once"""
+
+        class TestClass:
+            def test_method(self, x):
+                return x
+
+        instance = TestClass()
+
+        with patch("easy_cache.services.key_generator.inspect.signature", wraps=inspect.signature) as mock_signature:
+            first = self.generator._simple_params(func=TestClass.test_method, args=(instance, 1), kwargs={})
+            second = self.generator._simple_params(func=TestClass.test_method, args=(instance, 1), kwargs={})
+
+        self.assertEqual(first, "1")
+        self.assertEqual(first, second)
+        mock_signature.assert_called_once_with(TestClass.test_method)
+
     def test_simple_params_with_django_model(self):
         """Test _simple_params with Django model objects"""
         # Mock Django model
@@ -203,6 +438,7 @@ class TestKeyGenerator(TestCase):
         # Should be hashed and start with underscore
         self.assertTrue(result.startswith("_"))
         self.assertEqual(len(result), 9)  # 1 underscore + 8 hash chars
+        self.assertEqual(result, "_" + hashlib.blake2b(long_string.encode(), digest_size=4).hexdigest())
 
     def test_process_value_non_string_types(self):
         """Test _process_value with non-string types"""
@@ -262,9 +498,9 @@ class TestKeyGenerator(TestCase):
         def regular_function():
             pass
 
-        key1 = self.generator.generate_key(func=regular_function, args=(), kwargs={}, expiration_date=None)
+        _, function_name, _ = self.generator.build_key(func=regular_function, args=(), kwargs={})
 
-        self.assertIn("regular_function", self.generator.function_name)
+        self.assertIn("regular_function", function_name)
 
         # Method
         class TestClass:
@@ -272,9 +508,9 @@ class TestKeyGenerator(TestCase):
                 pass
 
         instance = TestClass()
-        key2 = self.generator.generate_key(func=instance.test_method, args=(instance,), kwargs={}, expiration_date=None)
+        _, function_name, _ = self.generator.build_key(func=instance.test_method, args=(instance,), kwargs={})
 
-        self.assertIn("TestClass.test_method", self.generator.function_name)
+        self.assertIn("TestClass.test_method", function_name)
 
     def test_hash_consistency(self):
         """Test that parameter hashing is consistent"""
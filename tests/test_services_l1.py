@@ -0,0 +1,61 @@
+"""Unit tests for the process-local L1 cache"""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from easy_cache.services.l1 import L1Cache
+
+
+class TestL1Cache(SimpleTestCase):
+    """Test cases for L1Cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.l1 = L1Cache(maxsize=2)
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned before it expires"""
+        self.l1.set("key", "value", 60)
+        self.assertEqual(self.l1.get("key"), "value")
+
+    def test_get_returns_independent_copies(self):
+        """Test that mutating a returned value does not change what later gets return"""
+        value = {"items": [1, 2]}
+        self.l1.set("key", value, 60)
+        value["items"].append(3)
+
+        first = self.l1.get("key")
+        first["items"].append(4)
+
+        self.assertEqual(self.l1.get("key"), {"items": [1, 2]})
+
+    def test_get_missing_returns_default(self):
+        """Test that a missing key returns the default"""
+        self.assertIsNone(self.l1.get("missing"))
+        self.assertEqual(self.l1.get("missing", "fallback"), "fallback")
+
+    @patch("easy_cache.services.l1.time.monotonic")
+    def test_expired_value_is_dropped(self, mock_monotonic):
+        """Test that values are not returned after their timeout"""
+        mock_monotonic.return_value = 100.0
+        self.l1.set("key", "value", 10)
+
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(self.l1.get("key"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction when maxsize is exceeded"""
+        self.l1.set("a", 1, 60)
+        self.l1.set("b", 2, 60)
+        self.l1.get("a")
+        self.l1.set("c", 3, 60)
+
+        self.assertEqual(self.l1.get("a"), 1)
+        self.assertIsNone(self.l1.get("b"))
+        self.assertEqual(self.l1.get("c"), 3)
+
+    def test_non_positive_timeout_is_not_stored(self):
+        """Test that values without a positive timeout are not stored"""
+        self.l1.set("key", "value", 0)
+        self.assertIsNone(self.l1.get("key"))
@@ -2,13 +2,13 @@
 
 from datetime import timedelta
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from easy_cache.utils.format_duration_ms import format_duration_ms
 from easy_cache.utils.format_time_left import format_time_left
 
 
-class TestFormatDurationMs(TestCase):
+class TestFormatDurationMs(SimpleTestCase):
     """Test cases for format_duration_ms utility"""
 
     def test_none_duration(self):
@@ -32,10 +32,8 @@ class TestFormatDurationMs(TestCase):
             (999, "999ms"),
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_second_durations(self):
         """Test format_duration_ms with second-level durations"""
@@ -47,10 +45,8 @@ class TestFormatDurationMs(TestCase):
             (59999, "60.0s"),
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_minute_durations(self):
         """Test format_duration_ms with minute-level durations"""
@@ -62,10 +58,8 @@ class TestFormatDurationMs(TestCase):
             (3599000, "59m 59s"),  # Just under 1 hour
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_hour_durations(self):
         """Test format_duration_ms with hour-level durations"""
@@ -77,10 +71,8 @@ class TestFormatDurationMs(TestCase):
             (86399000, "1439m 59s"),  # Just under 1 day
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_day_durations(self):
         """Test format_duration_ms with day-level durations"""
@@ -91,10 +83,8 @@ class TestFormatDurationMs(TestCase):
             (604800000, "10080m"),  # 1 week
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_float_durations(self):
         """Test format_duration_ms with float inputs"""
@@ -106,10 +96,8 @@ class TestFormatDurationMs(TestCase):
             (1500.7, "1.5s"),  # Seconds with decimals
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_negative_durations(self):
         """Test format_duration_ms with negative durations"""
@@ -119,10 +107,8 @@ class TestFormatDurationMs(TestCase):
             (-60000, "-60000ms"),
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_edge_case_boundary_values(self):
         """Test format_duration_ms with boundary values"""
@@ -135,13 +121,18 @@ class TestFormatDurationMs(TestCase):
             (60001, "1m"),  # Just over 1 minute
         ]
 
-        for duration, expected in test_cases:
-            with self.subTest(duration=duration):
-                result = format_duration_ms(duration)
-                self.assertEqual(result, expected)
+        results = [format_duration_ms(duration) for duration, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
+    def test_repeated_durations_are_memoized(self):
+        """Test that formatting the same duration twice is served from the cache"""
+        format_duration_ms.cache_clear()
 
-class TestFormatTimeLeft(TestCase):
+        self.assertEqual(format_duration_ms(90000), format_duration_ms(90000))
+        self.assertEqual(format_duration_ms.cache_info().hits, 1)
+
+
+class TestFormatTimeLeft(SimpleTestCase):
     """Test cases for format_time_left utility"""
 
     def test_none_timedelta(self):
@@ -164,10 +155,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(seconds=59), "59 seconds"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_minute_timedeltas(self):
         """Test format_time_left with minute-level timedeltas"""
@@ -178,10 +167,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(minutes=59, seconds=59), "59 minutes 59 seconds"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_hour_timedeltas(self):
         """Test format_time_left with hour-level timedeltas"""
@@ -192,10 +179,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(hours=23, minutes=59), "23 hours 59 minutes"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_day_timedeltas(self):
         """Test format_time_left with day-level timedeltas"""
@@ -206,10 +191,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(days=365), "1 year"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_complex_timedeltas(self):
         """Test format_time_left with complex timedeltas"""
@@ -220,10 +203,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(seconds=3661), "1 hour 1 minute"),  # 3661 seconds = 1h 1m 1s, but shows 1h 1m
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_microsecond_precision(self):
         """Test format_time_left with microsecond precision"""
@@ -233,10 +214,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(seconds=1, microseconds=999999), "1 second"),  # 1.999999 seconds rounds to 1
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_negative_timedeltas(self):
         """Test format_time_left with negative timedeltas"""
@@ -247,10 +226,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(days=-1), "expired"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_edge_case_boundary_values(self):
         """Test format_time_left with boundary values"""
@@ -264,10 +241,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(hours=24), "1 day"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_large_timedeltas(self):
         """Test format_time_left with very large timedeltas"""
@@ -277,10 +252,8 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(days=1000), "2 years 8 months"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
     def test_fractional_seconds_rounding(self):
         """Test that fractional seconds are handled correctly"""
@@ -292,13 +265,11 @@ class TestFormatTimeLeft(TestCase):
             (timedelta(minutes=1, seconds=0.1), "1 minute"),
         ]
 
-        for td, expected in test_cases:
-            with self.subTest(timedelta=td):
-                result = format_time_left(td)
-                self.assertEqual(result, expected)
+        results = [format_time_left(td) for td, _ in test_cases]
+        self.assertEqual(results, [expected for _, expected in test_cases])
 
 
-class TestUtilityFunctionsIntegration(TestCase):
+class TestUtilityFunctionsIntegration(SimpleTestCase):
     """Integration tests for utility functions"""
 
     def test_format_duration_ms_with_real_measurements(self):
@@ -313,10 +284,10 @@ class TestUtilityFunctionsIntegration(TestCase):
             (5000.0, "5s"),  # Very slow operation
         ]
 
-        for duration_ms, expected in realistic_durations:
-            with self.subTest(duration=duration_ms):
-                result = format_duration_ms(duration_ms)
-                self.assertEqual(result, expected)
+        self.assertEqual(
+            [format_duration_ms(duration_ms) for duration_ms, _ in realistic_durations],
+            [expected for _, expected in realistic_durations],
+        )
 
     def test_format_time_left_with_real_cache_timeouts(self):
         """Test format_time_left with realistic cache timeout scenarios"""
@@ -330,10 +301,10 @@ class TestUtilityFunctionsIntegration(TestCase):
             (timedelta(days=7), "1 week"),  # Weekly cache
         ]
 
-        for timeout, expected in realistic_timeouts:
-            with self.subTest(timeout=timeout):
-                result = format_time_left(timeout)
-                self.assertEqual(result, expected)
+        self.assertEqual(
+            [format_time_left(timeout) for timeout, _ in realistic_timeouts],
+            [expected for _, expected in realistic_timeouts],
+        )
 
     def test_consistency_between_utilities(self):
         """Test consistency between format_duration_ms and format_time_left"""